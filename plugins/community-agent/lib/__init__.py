@@ -3,42 +3,59 @@
 Shared utilities for all community agent plugins (Discord, Telegram, etc).
 """
 
-from .config import (
-    CommunityConfig,
-    ConfigError,
-    SetupError,
-    SetupState,
-    get_config,
-    reload_config,
-    is_first_run,
-    get_setup_state,
-    DEFAULT_CONFIG,
-)
-from .storage_base import (
-    StorageError,
-    ensure_dir,
-    sanitize_name,
-    slugify,
-    parse_last_n_messages,
-    search_message_blocks,
-)
-from .markdown_base import (
-    format_reply_indicator,
-    format_date_header,
-    group_messages_by_date,
-    format_size_bytes,
-)
-from .rate_limiter_base import (
-    format_duration,
-    estimate_sync_time,
-)
-from .profile import (
-    UserProfile,
-    load_profile,
-    ensure_profile,
-    get_profile,
-    PROFILE_TEMPLATE,
-)
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing one piece of the package doesn't
+# pay for every dependency of the others.
+_LAZY_ATTRS = {
+    # config
+    "CommunityConfig": "config",
+    "ConfigError": "config",
+    "SetupError": "config",
+    "SetupState": "config",
+    "DiscordConfig": "config",
+    "TelegramConfig": "config",
+    "get_config": "config",
+    "reload_config": "config",
+    "is_first_run": "config",
+    "get_setup_state": "config",
+    "DEFAULT_CONFIG": "config",
+    # storage_base
+    "StorageError": "storage_base",
+    "ensure_dir": "storage_base",
+    "sanitize_name": "storage_base",
+    "slugify": "storage_base",
+    "parse_last_n_messages": "storage_base",
+    "search_message_blocks": "storage_base",
+    # markdown_base
+    "format_reply_indicator": "markdown_base",
+    "format_date_header": "markdown_base",
+    "group_messages_by_date": "markdown_base",
+    "format_size_bytes": "markdown_base",
+    # rate_limiter_base
+    "format_duration": "rate_limiter_base",
+    "estimate_sync_time": "rate_limiter_base",
+    # profile
+    "UserProfile": "profile",
+    "load_profile": "profile",
+    "ensure_profile": "profile",
+    "get_profile": "profile",
+    "PROFILE_TEMPLATE": "profile",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Config
@@ -46,6 +63,8 @@ __all__ = [
     "ConfigError",
     "SetupError",
     "SetupState",
+    "DiscordConfig",
+    "TelegramConfig",
     "get_config",
     "reload_config",
     "is_first_run",
@@ -3,14 +3,167 @@
 Loads from config/agents.yaml with platform-specific sections.
 """
 
+import copy
+import json
 import os
-from dataclasses import dataclass
+import re
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
-import yaml
-from dotenv import load_dotenv
+# yaml and dotenv are imported on first use: callers that only need a
+# helper from this package shouldn't pay their import cost.
+
+# Characters invalid in file paths across platforms, mapped to "_"
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]+')
+
+
+@lru_cache(maxsize=1)
+def _yaml_backend():
+    """Import PyYAML, returning (yaml, Loader, Dumper) with libyaml if available."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+# Parsed agents.yaml keyed by (path, mtime_ns, size); the file rarely
+# changes, so reload_config() can skip the YAML parse entirely.
+_PARSE_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_PARSE_CACHE_SIZE = 16
+
+
+def _read_config_file(filepath: Path, st: os.stat_result) -> dict:
+    """Parse agents.yaml, going through its JSON sidecar when it is fresh.
+
+    agents.yaml.json is written next to the YAML after each parse and
+    records the YAML's (mtime_ns, size). It is reused only while both
+    still match exactly, so the YAML parser only runs after the file has
+    actually been edited, even on filesystems with coarse timestamps.
+    Configs that JSON can't represent faithfully never get a sidecar.
+    """
+    sidecar = filepath.with_name(filepath.name + ".json")
+    stamp = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(sidecar, "rb") as f:
+            cached = json.load(f)
+        if cached.get("source") == stamp:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    yaml, loader, _ = _yaml_backend()
+    # libyaml takes bytes directly, skipping a text decode
+    with open(filepath, "rb") as f:
+        data = yaml.load(f, Loader=loader) or {}
+    _write_json_sidecar(sidecar, data, stamp)
+    return data
+
+
+def _has_only_str_keys(node) -> bool:
+    """True if every mapping key in a parsed YAML tree is a string.
+
+    JSON would stringify other keys (e.g. unquoted server IDs), so the
+    sidecar would load different data than the YAML.
+    """
+    if isinstance(node, dict):
+        return all(
+            isinstance(key, str) and _has_only_str_keys(value)
+            for key, value in node.items()
+        )
+    if isinstance(node, list):
+        return all(_has_only_str_keys(item) for item in node)
+    return True
+
+
+def _write_json_sidecar(sidecar: Path, data: dict, stamp: list) -> None:
+    """Atomically write the JSON cache of agents.yaml (best effort)."""
+    if not _has_only_str_keys(data):
+        return
+    try:
+        payload = json.dumps({"source": stamp, "data": data}, ensure_ascii=False)
+    except (TypeError, ValueError):
+        # YAML-only types (e.g. unquoted dates) can't round-trip; skip the cache
+        return
+    try:
+        _atomic_write_text(sidecar, payload)
+    except OSError:
+        pass
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path via a temp file in the same directory + os.replace.
+
+    Readers see either the old or the new file, never a partial write.
+    An existing file's permissions are carried over to the replacement.
+    """
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f".{path.name}-", suffix=".tmp",
+            encoding="utf-8", delete=False,
+        ) as f:
+            tmp_path = f.name
+            f.write(text)
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        raise
+
+
+# Parsed .env contents keyed by (path, mtime_ns)
+_ENV_CACHE: dict = {}
+
+
+def _parse_env_file(path: Path) -> dict:
+    """Parse a .env file with python-dotenv, dropping keys without a value."""
+    from dotenv import dotenv_values
+    return {
+        name: value
+        for name, value in dotenv_values(path).items()
+        if value is not None
+    }
+
+
+def _load_env_file(path: Path) -> None:
+    """Load a .env file into os.environ without overriding existing values."""
+    try:
+        key = (str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return
+    values = _ENV_CACHE.get(key)
+    if values is None:
+        try:
+            values = _parse_env_file(path)
+        except (OSError, UnicodeDecodeError):
+            return
+        _ENV_CACHE[key] = values
+    for name, value in values.items():
+        os.environ.setdefault(name, value)
+
+
+def _snapshot_property(path: str, doc: str) -> property:
+    """Read-only property for a field of the discord/telegram snapshots.
+
+    The getter is a C-level attrgetter, so each access is a single call
+    with no Python frame.
+    """
+    return property(attrgetter(path), doc=doc)
 
 
 class ConfigError(Exception):
@@ -80,6 +233,109 @@ class SetupState:
         return self.telegram_credentials_set and self.telegram_group_configured
 
 
+def _coerce(value, type_, key: str):
+    """Coerce a config value once at load, naming the offending key on failure."""
+    try:
+        return type_(value)
+    except (TypeError, ValueError):
+        raise ConfigError(
+            f"Invalid value for '{key}' in agents.yaml: {value!r} "
+            f"(expected {type_.__name__})"
+        ) from None
+
+
+@dataclass(frozen=True, slots=True)
+class DiscordConfig:
+    """Immutable snapshot of the discord section of agents.yaml.
+
+    Built once when the config is loaded so hot sync loops read plain
+    attributes instead of walking nested dicts on every access. Values
+    are coerced here, so a malformed config fails fast with ConfigError.
+    """
+    server_id: Optional[str] = None
+    server_name: Optional[str] = None
+    retention_days: int = 30
+    max_messages_per_channel: int = 1000
+    max_channels_per_server: int = 20
+    priority_channels: list = field(default_factory=lambda: ["general", "announcements"])
+    rate_limit_base_delay: float = 1.0
+    rate_limit_max_delay: float = 60.0
+    parallel_channels: int = 5
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "DiscordConfig":
+        """Build from the raw discord section."""
+        data = data or {}
+        sync_limits = data.get("sync_limits") or {}
+        rate_limits = data.get("rate_limits") or {}
+        server_id = data.get("default_server_id")
+        return cls(
+            server_id=str(server_id) if server_id else None,
+            server_name=data.get("default_server_name"),
+            retention_days=_coerce(
+                data.get("retention_days", 30), int, "discord.retention_days"
+            ),
+            max_messages_per_channel=_coerce(
+                sync_limits.get("max_messages_per_channel", 1000), int,
+                "discord.sync_limits.max_messages_per_channel",
+            ),
+            max_channels_per_server=_coerce(
+                sync_limits.get("max_channels_per_server", 20), int,
+                "discord.sync_limits.max_channels_per_server",
+            ),
+            priority_channels=sync_limits.get("priority_channels", ["general", "announcements"]),
+            rate_limit_base_delay=_coerce(
+                rate_limits.get("base_delay", 1.0), float, "discord.rate_limits.base_delay"
+            ),
+            rate_limit_max_delay=_coerce(
+                rate_limits.get("max_delay", 60.0), float, "discord.rate_limits.max_delay"
+            ),
+            parallel_channels=_coerce(
+                rate_limits.get("parallel_channels", 5), int,
+                "discord.rate_limits.parallel_channels",
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramConfig:
+    """Immutable snapshot of the telegram section of agents.yaml."""
+    default_group_id: Optional[int] = None
+    default_group_name: Optional[str] = None
+    retention_days: int = 7
+    max_messages_per_group: int = 2000
+    max_groups: int = 10
+    rate_limit_min_interval_ms: int = 100
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "TelegramConfig":
+        """Build from the raw telegram section."""
+        data = data or {}
+        sync_limits = data.get("sync_limits") or {}
+        rate_limits = data.get("rate_limits") or {}
+        group_id = data.get("default_group_id")
+        return cls(
+            default_group_id=(
+                _coerce(group_id, int, "telegram.default_group_id") if group_id else None
+            ),
+            default_group_name=data.get("default_group_name"),
+            retention_days=_coerce(
+                data.get("retention_days", 7), int, "telegram.retention_days"
+            ),
+            max_messages_per_group=_coerce(
+                sync_limits.get("max_messages_per_group", 2000), int,
+                "telegram.sync_limits.max_messages_per_group",
+            ),
+            max_groups=_coerce(
+                sync_limits.get("max_groups", 10), int, "telegram.sync_limits.max_groups"
+            ),
+            rate_limit_min_interval_ms=_coerce(
+                rate_limits.get("min_interval_ms", 100), int,
+                "telegram.rate_limits.min_interval_ms",
+            ),
+        )
+
+
 DEFAULT_CONFIG = """# Community Agent Configuration
 # Shared settings for all platform connectors
 
@@ -157,10 +413,22 @@ class CommunityConfig:
         self._env_file = env_file or self._base_dir / ".env"
 
         # Load environment variables
-        load_dotenv(self._env_file)
+        _load_env_file(self._env_file)
 
         # Load unified config
         self._config = self._load_config()
+        self._refresh_sections()
+        # (persona config it was compiled from, compiled prompt function)
+        self._persona_prompt: Optional[tuple] = None
+
+        # Resolved once: the sync paths below are built per channel/message
+        data_dir = Path(self._config.get("data_dir", "./data"))
+        self._data_dir = data_dir if data_dir.is_absolute() else self._base_dir / data_dir
+
+    def _refresh_sections(self) -> None:
+        """Rebuild the frozen platform snapshots from the raw config."""
+        self.discord = DiscordConfig.from_dict(self._config.get("discord"))
+        self.telegram = TelegramConfig.from_dict(self._config.get("telegram"))
 
     def _load_config(self) -> dict:
         """Load config from agents.yaml, creating with defaults if missing."""
@@ -169,8 +437,20 @@ class CommunityConfig:
         if not filepath.exists():
             self._create_default_config(filepath)
 
-        with open(filepath, "r") as f:
-            return yaml.safe_load(f) or {}
+        st = filepath.stat()
+        key = (str(filepath), st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+            # Callers mutate the config via set_* methods, so hand out a copy
+            return copy.deepcopy(cached)
+
+        data = _read_config_file(filepath, st)
+
+        _PARSE_CACHE[key] = data
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+        return copy.deepcopy(data)
 
     def _create_default_config(self, filepath: Path) -> None:
         """Create default agents.yaml."""
@@ -178,10 +458,12 @@ class CommunityConfig:
         with open(filepath, "w") as f:
             f.write(DEFAULT_CONFIG)
         # Set creation timestamp
-        self._config = yaml.safe_load(DEFAULT_CONFIG) or {}
+        yaml, loader, dumper = _yaml_backend()
+        self._config = yaml.load(DEFAULT_CONFIG, Loader=loader) or {}
         self._config.setdefault("_meta", {})["created_at"] = datetime.now().isoformat()
-        with open(filepath, "w") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False)
+        _atomic_write_text(
+            filepath, yaml.dump(self._config, Dumper=dumper, default_flow_style=False)
+        )
         print(f"Created default config at {filepath}")
 
     def save_config(self) -> None:
@@ -190,8 +472,11 @@ class CommunityConfig:
         filepath.parent.mkdir(parents=True, exist_ok=True)
         # Update last_run_at timestamp
         self._config.setdefault("_meta", {})["last_run_at"] = datetime.now().isoformat()
-        with open(filepath, "w") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False)
+        yaml, _, dumper = _yaml_backend()
+        # Serialize in memory, then swap the file in with a single write
+        _atomic_write_text(
+            filepath, yaml.dump(self._config, Dumper=dumper, default_flow_style=False)
+        )
 
     # -------------------------------------------------------------------------
     # Setup state detection
@@ -280,11 +565,7 @@ class CommunityConfig:
     @property
     def data_dir(self) -> Path:
         """Get shared data directory path."""
-        data_dir = self._config.get("data_dir", "./data")
-        path = Path(data_dir)
-        if not path.is_absolute():
-            path = self._base_dir / path
-        return path
+        return self._data_dir
 
     @property
     def config_path(self) -> Path:
@@ -409,60 +690,38 @@ class CommunityConfig:
         """Check if the current token is a bot token."""
         return self.discord_token_type == "bot"
 
-    @property
-    def discord_server_id(self) -> Optional[str]:
-        """Get default Discord server ID."""
-        discord = self._config.get("discord", {})
-        server_id = discord.get("default_server_id")
-        return str(server_id) if server_id else None
-
-    @property
-    def discord_retention_days(self) -> int:
-        """Get Discord message retention days (default 30)."""
-        discord = self._config.get("discord", {})
-        return int(discord.get("retention_days", 30))
-
-    @property
-    def discord_max_messages_per_channel(self) -> int:
-        """Get max messages to sync per Discord channel (default 1000)."""
-        discord = self._config.get("discord", {})
-        sync_limits = discord.get("sync_limits", {})
-        return int(sync_limits.get("max_messages_per_channel", 1000))
-
-    @property
-    def discord_max_channels_per_server(self) -> int:
-        """Get max channels to sync per Discord server (default 20)."""
-        discord = self._config.get("discord", {})
-        sync_limits = discord.get("sync_limits", {})
-        return int(sync_limits.get("max_channels_per_server", 20))
-
-    @property
-    def discord_priority_channels(self) -> list:
-        """Get list of priority Discord channel names to sync first."""
-        discord = self._config.get("discord", {})
-        sync_limits = discord.get("sync_limits", {})
-        return sync_limits.get("priority_channels", ["general", "announcements"])
-
-    @property
-    def discord_rate_limit_base_delay(self) -> float:
-        """Get base delay between Discord requests in seconds (default 1.0)."""
-        discord = self._config.get("discord", {})
-        rate_limits = discord.get("rate_limits", {})
-        return float(rate_limits.get("base_delay", 1.0))
-
-    @property
-    def discord_rate_limit_max_delay(self) -> float:
-        """Get max backoff delay for Discord in seconds (default 60.0)."""
-        discord = self._config.get("discord", {})
-        rate_limits = discord.get("rate_limits", {})
-        return float(rate_limits.get("max_delay", 60.0))
-
-    @property
-    def discord_parallel_channels(self) -> int:
-        """Get max concurrent Discord channels to sync (default 5)."""
-        discord = self._config.get("discord", {})
-        rate_limits = discord.get("rate_limits", {})
-        return int(rate_limits.get("parallel_channels", 5))
+    discord_server_id = _snapshot_property(
+        "discord.server_id",
+        "Get default Discord server ID.",
+    )
+    discord_retention_days = _snapshot_property(
+        "discord.retention_days",
+        "Get Discord message retention days (default 30).",
+    )
+    discord_max_messages_per_channel = _snapshot_property(
+        "discord.max_messages_per_channel",
+        "Get max messages to sync per Discord channel (default 1000).",
+    )
+    discord_max_channels_per_server = _snapshot_property(
+        "discord.max_channels_per_server",
+        "Get max channels to sync per Discord server (default 20).",
+    )
+    discord_priority_channels = _snapshot_property(
+        "discord.priority_channels",
+        "Get list of priority Discord channel names to sync first.",
+    )
+    discord_rate_limit_base_delay = _snapshot_property(
+        "discord.rate_limit_base_delay",
+        "Get base delay between Discord requests in seconds (default 1.0).",
+    )
+    discord_rate_limit_max_delay = _snapshot_property(
+        "discord.rate_limit_max_delay",
+        "Get max backoff delay for Discord in seconds (default 60.0).",
+    )
+    discord_parallel_channels = _snapshot_property(
+        "discord.parallel_channels",
+        "Get max concurrent Discord channels to sync (default 5).",
+    )
 
     def set_discord_server(self, server_id: str, server_name: str) -> None:
         """Set the default Discord server."""
@@ -470,6 +729,7 @@ class CommunityConfig:
             self._config["discord"] = {}
         self._config["discord"]["default_server_id"] = server_id
         self._config["discord"]["default_server_name"] = server_name
+        self._refresh_sections()
         self.save_config()
 
     def get_discord_server_data_dir(self, server_id: str, server_name: Optional[str] = None) -> Path:
@@ -527,45 +787,30 @@ class CommunityConfig:
             )
         return session
 
-    @property
-    def telegram_default_group_id(self) -> Optional[int]:
-        """Get default Telegram group ID."""
-        telegram = self._config.get("telegram", {})
-        group_id = telegram.get("default_group_id")
-        return int(group_id) if group_id else None
-
-    @property
-    def telegram_default_group_name(self) -> Optional[str]:
-        """Get default Telegram group name."""
-        telegram = self._config.get("telegram", {})
-        return telegram.get("default_group_name")
-
-    @property
-    def telegram_retention_days(self) -> int:
-        """Get Telegram message retention days (default 7)."""
-        telegram = self._config.get("telegram", {})
-        return int(telegram.get("retention_days", 7))
-
-    @property
-    def telegram_max_messages_per_group(self) -> int:
-        """Get max messages to sync per Telegram group (default 2000)."""
-        telegram = self._config.get("telegram", {})
-        sync_limits = telegram.get("sync_limits", {})
-        return int(sync_limits.get("max_messages_per_group", 2000))
-
-    @property
-    def telegram_max_groups(self) -> int:
-        """Get max Telegram groups to sync (default 10)."""
-        telegram = self._config.get("telegram", {})
-        sync_limits = telegram.get("sync_limits", {})
-        return int(sync_limits.get("max_groups", 10))
-
-    @property
-    def telegram_rate_limit_min_interval_ms(self) -> int:
-        """Get minimum interval between Telegram requests in ms (default 100)."""
-        telegram = self._config.get("telegram", {})
-        rate_limits = telegram.get("rate_limits", {})
-        return int(rate_limits.get("min_interval_ms", 100))
+    telegram_default_group_id = _snapshot_property(
+        "telegram.default_group_id",
+        "Get default Telegram group ID.",
+    )
+    telegram_default_group_name = _snapshot_property(
+        "telegram.default_group_name",
+        "Get default Telegram group name.",
+    )
+    telegram_retention_days = _snapshot_property(
+        "telegram.retention_days",
+        "Get Telegram message retention days (default 7).",
+    )
+    telegram_max_messages_per_group = _snapshot_property(
+        "telegram.max_messages_per_group",
+        "Get max messages to sync per Telegram group (default 2000).",
+    )
+    telegram_max_groups = _snapshot_property(
+        "telegram.max_groups",
+        "Get max Telegram groups to sync (default 10).",
+    )
+    telegram_rate_limit_min_interval_ms = _snapshot_property(
+        "telegram.rate_limit_min_interval_ms",
+        "Get minimum interval between Telegram requests in ms (default 100).",
+    )
 
     def set_telegram_group(self, group_id: int, group_name: str) -> None:
         """Set the default Telegram group."""
@@ -573,6 +818,7 @@ class CommunityConfig:
             self._config["telegram"] = {}
         self._config["telegram"]["default_group_id"] = group_id
         self._config["telegram"]["default_group_name"] = group_name
+        self._refresh_sections()
         self.save_config()
 
     def get_telegram_group_data_dir(
@@ -623,6 +869,7 @@ class CommunityConfig:
             persona_data: Dictionary with persona fields
         """
         self._config["persona"] = persona_data
+        self._persona_prompt = None
         self.save_config()
 
     def set_persona_from_preset(self, preset: str) -> None:
@@ -644,15 +891,20 @@ class CommunityConfig:
         Returns:
             LLM-ready prompt describing the persona
         """
-        from .persona import BotPersona
+        from .persona import BotPersona, compile_prompt
 
         persona_data = self.persona
         if not persona_data:
             from .persona import get_default_persona
             return get_default_persona().to_prompt()
 
-        persona = BotPersona.from_dict(persona_data)
-        return persona.to_prompt()
+        # Reuse the compiled prompt while the persona config is unchanged;
+        # compared by value since callers can edit self.persona in place
+        cached = self._persona_prompt
+        if cached is None or cached[0] != persona_data:
+            prompt = compile_prompt(BotPersona.from_dict(persona_data))
+            cached = self._persona_prompt = (copy.deepcopy(persona_data), prompt)
+        return cached[1]()
 
     # -------------------------------------------------------------------------
     # Utility methods
@@ -661,18 +913,15 @@ class CommunityConfig:
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """Sanitize a string for use as filename."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        return name.lower().strip()
+        return name.translate(_SANITIZE_TABLE).lower().strip()
 
     @staticmethod
     def _slugify(name: str) -> str:
         """Convert a name to a URL-friendly slug."""
-        import re
-        slug = re.sub(r'[^\w\s-]', '', name.lower())
-        slug = re.sub(r'[\s_]+', '-', slug)
-        slug = slug.strip('-')
+        # One regex pass to drop punctuation; whitespace/underscore runs are
+        # collapsed by str.split, which matches the same characters as \s
+        slug = _SLUG_STRIP_RE.sub('', name.lower())
+        slug = '-'.join(slug.replace('_', ' ').split()).strip('-')
         return slug[:50]
 
 
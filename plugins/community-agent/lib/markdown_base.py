@@ -3,10 +3,16 @@
 Shared formatting functions for Discord, Telegram, and other platforms.
 """
 
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List
 
+_KB = 1 << 10
+_MB = 1 << 20
 
+
+@lru_cache(maxsize=2048)
 def format_reply_indicator(reply_to_author: str) -> str:
     """Format a reply indicator line.
 
@@ -19,6 +25,7 @@ def format_reply_indicator(reply_to_author: str) -> str:
     return f"↳ replying to @{reply_to_author}:"
 
 
+@lru_cache(maxsize=2048)
 def format_date_header(date_str: str) -> str:
     """Format a date section header.
 
@@ -40,22 +47,25 @@ def group_messages_by_date(messages: List[dict]) -> Dict[str, List[dict]]:
     Returns:
         Dict mapping date strings (YYYY-MM-DD) to lists of messages
     """
-    groups: Dict[str, List[dict]] = {}
+    groups: Dict[str, List[dict]] = defaultdict(list)
 
     for msg in messages:
-        timestamp = msg.get("timestamp", "")
+        timestamp = msg.get("timestamp")
         if not timestamp:
             continue
 
-        # Extract date from ISO timestamp
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        date_str = dt.strftime("%Y-%m-%d")
+        # ISO 8601 timestamps start with the date, so slice it out directly;
+        # only parse when the string isn't in YYYY-MM-DD... form
+        if len(timestamp) >= 10 and timestamp[4] == "-" and timestamp[7] == "-":
+            date_str = timestamp[:10]
+        else:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            date_str = dt.strftime("%Y-%m-%d")
 
-        if date_str not in groups:
-            groups[date_str] = []
         groups[date_str].append(msg)
 
-    return groups
+    # Plain dict so missing dates don't silently insert empty lists
+    return dict(groups)
 
 
 def format_size_bytes(size_bytes: int) -> str:
@@ -67,9 +77,19 @@ def format_size_bytes(size_bytes: int) -> str:
     Returns:
         Human-readable size string (e.g., "1.5MB", "256KB", "512B")
     """
-    if size_bytes >= 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f}MB"
-    elif size_bytes >= 1024:
-        return f"{size_bytes / 1024:.0f}KB"
+    if size_bytes >= _MB:
+        # Tenths of a MB, rounded half-to-even like the float formatting was
+        tenths = _round_div(size_bytes * 10, _MB)
+        return f"{tenths // 10}.{tenths % 10}MB"
+    elif size_bytes >= _KB:
+        return f"{_round_div(size_bytes, _KB)}KB"
     else:
         return f"{size_bytes}B"
+
+
+def _round_div(n: int, d: int) -> int:
+    """Integer n / d rounded half-to-even (d is a power of two)."""
+    q, r = divmod(n, d)
+    if r << 1 > d or (r << 1 == d and q & 1):
+        q += 1
+    return q
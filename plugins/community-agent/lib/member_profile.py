@@ -4,7 +4,8 @@ This module provides persistent storage for community member profiles,
 enabling the community agent to build understanding of members over time.
 
 Profiles are platform-scoped (one global profile per member per platform),
-stored as YAML files with a rolling limit of 50 observations per profile.
+stored as JSON files with a rolling limit of 50 observations per profile.
+Profiles and indexes written by older versions as YAML are still read.
 
 Usage:
     from lib.member_profile import ProfileStore, create_profile
@@ -25,14 +26,75 @@ Usage:
     results = store.search("discord", "python developer")
 """
 
+import bisect
+import json
 import os
-import tempfile
+import re
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
 
-import yaml
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used otherwise
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _yaml_backend():
+    """Import PyYAML, returning (yaml, Loader, Dumper) with libyaml if available."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _format_day(day: date) -> str:
+    """Format a date as YYYY-MM-DD for the index; profiles share few days."""
+    return day.strftime("%Y-%m-%d")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to path via a sibling temp file and os.replace.
+
+    The temp name is fixed per process (hidden, tagged with the pid), which
+    is cheaper than mkstemp's unique-name search; a store has one writer
+    per process, so names can't collide.
+    """
+    temp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+    fd = os.open(temp_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
 
 
 # === Constants ===
@@ -44,22 +106,145 @@ MAX_OBSERVATION_LENGTH = 500
 MAX_NOTES_LENGTH = 2000
 SUPPORTED_PLATFORMS = ("discord", "telegram")
 INDEX_VERSION = 1
+PROFILE_CACHE_SIZE = 1024  # Parsed profiles kept in memory per store
+PARALLEL_REBUILD_MIN_FILES = 256  # Below this, rebuild_index parses serially
+
+# Characters dropped from words before keyword counting: everything that
+# isn't alphanumeric (\w minus "_") or whitespace
+_KEYWORD_STRIP_RE = re.compile(r"[^\w\s]|_")
+
+# Common words never used as profile keywords
+_STOPWORDS = frozenset({
+    "the",
+    "a",
+    "an",
+    "is",
+    "are",
+    "was",
+    "were",
+    "be",
+    "been",
+    "being",
+    "have",
+    "has",
+    "had",
+    "do",
+    "does",
+    "did",
+    "will",
+    "would",
+    "could",
+    "should",
+    "may",
+    "might",
+    "must",
+    "shall",
+    "can",
+    "need",
+    "dare",
+    "ought",
+    "used",
+    "to",
+    "of",
+    "in",
+    "for",
+    "on",
+    "with",
+    "at",
+    "by",
+    "from",
+    "as",
+    "into",
+    "through",
+    "during",
+    "before",
+    "after",
+    "above",
+    "below",
+    "between",
+    "under",
+    "again",
+    "further",
+    "then",
+    "once",
+    "and",
+    "but",
+    "or",
+    "nor",
+    "so",
+    "yet",
+    "both",
+    "either",
+    "neither",
+    "not",
+    "only",
+    "own",
+    "same",
+    "than",
+    "too",
+    "very",
+    "just",
+    "i",
+    "me",
+    "my",
+    "myself",
+    "we",
+    "our",
+    "ours",
+    "ourselves",
+    "you",
+    "your",
+    "yours",
+    "yourself",
+    "yourselves",
+    "he",
+    "him",
+    "his",
+    "himself",
+    "she",
+    "her",
+    "hers",
+    "herself",
+    "it",
+    "its",
+    "itself",
+    "they",
+    "them",
+    "their",
+    "theirs",
+    "themselves",
+    "what",
+    "which",
+    "who",
+    "whom",
+    "this",
+    "that",
+    "these",
+    "those",
+    "am",
+})
 
 
 # === Data Classes ===
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """A timestamped piece of information about a member."""
 
     timestamp: datetime
     text: str  # Max 500 chars
+    # Observations are never edited once recorded, so the ISO string is
+    # computed on first serialization and reused for every later save
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for YAML serialization."""
+        """Convert to dictionary for serialization."""
+        iso = self._iso
+        if iso is None:
+            iso = self._iso = self.timestamp.isoformat()
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": iso,
             "text": self.text,
         }
 
@@ -67,12 +252,14 @@ class Observation:
     def from_dict(cls, data: Dict[str, Any]) -> "Observation":
         """Create from dictionary."""
         timestamp = data["timestamp"]
-        if isinstance(timestamp, str):
+        try:
             timestamp = datetime.fromisoformat(timestamp)
+        except TypeError:
+            pass  # YAML already produced a datetime (!!timestamp)
         return cls(timestamp=timestamp, text=data["text"])
 
 
-@dataclass
+@dataclass(slots=True)
 class MemberProfile:
     """A community member's profile."""
 
@@ -84,16 +271,57 @@ class MemberProfile:
     observations: List[Observation] = field(default_factory=list)  # Max 50
     notes: str = ""  # Max 2000 chars
     keywords: List[str] = field(default_factory=list)  # Max 10
+    # Lowercased observation and notes text for deep search, plus the state
+    # it was built from; dropped by save() and rebuilt when that state moves
+    _search_blob: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for YAML serialization."""
+    def search_text(self) -> tuple:
+        """Return lowercased observations and notes as one searchable blob.
+
+        Observation texts and the notes are joined with NUL so a query can't
+        match across two of them.
+
+        Returns:
+            (blob, notes_start) where blob[notes_start:] is the notes
+        """
+        observations = self.observations
+        state = (
+            observations,
+            len(observations),
+            observations[0] if observations else None,
+            observations[-1] if observations else None,
+            self.notes,
+        )
+        blob = self._search_blob
+        if blob is not None and all(a is b for a, b in zip(blob[0], state)):
+            return blob[1]
+        observations_lc = "\0".join(obs.text.lower() for obs in observations)
+        text = (
+            f"{observations_lc}\0{self.notes.lower()}",
+            len(observations_lc) + 1,
+        )
+        self._search_blob = (state, text)
+        return text
+
+    def to_dict(
+        self, observations: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Args:
+            observations: Already-serialized observations to reuse, if any
+        """
+        if observations is None:
+            observations = [obs.to_dict() for obs in self.observations]
         return {
             "member_id": self.member_id,
             "platform": self.platform,
             "display_name": self.display_name,
             "first_seen": self.first_seen.isoformat(),
             "last_updated": self.last_updated.isoformat(),
-            "observations": [obs.to_dict() for obs in self.observations],
+            "observations": observations,
             "notes": self.notes,
             "keywords": self.keywords,
         }
@@ -101,21 +329,26 @@ class MemberProfile:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MemberProfile":
         """Create from dictionary."""
+        # Stored values are ISO strings; YAML may hand back datetimes instead
         first_seen = data["first_seen"]
-        if isinstance(first_seen, str):
+        try:
             first_seen = datetime.fromisoformat(first_seen)
+        except TypeError:
+            pass
 
         last_updated = data["last_updated"]
-        if isinstance(last_updated, str):
+        try:
             last_updated = datetime.fromisoformat(last_updated)
+        except TypeError:
+            pass
 
-        observations = [
-            Observation.from_dict(obs) for obs in data.get("observations", [])
-        ]
+        obs_from_dict = Observation.from_dict
+        observations = [obs_from_dict(obs) for obs in data.get("observations") or ()]
 
+        # Interned so index/cache dict lookups compare by identity
         return cls(
-            member_id=data["member_id"],
-            platform=data["platform"],
+            member_id=sys.intern(str(data["member_id"])),
+            platform=sys.intern(data["platform"]),
             display_name=data["display_name"],
             first_seen=first_seen,
             last_updated=last_updated,
@@ -124,8 +357,17 @@ class MemberProfile:
             keywords=data.get("keywords", []),
         )
 
+    def dumps(self, observations: Optional[List[Dict[str, Any]]] = None) -> bytes:
+        """Serialize to JSON bytes for storage (see to_dict)."""
+        return _json_dumps(self.to_dict(observations))
 
-@dataclass
+    @classmethod
+    def loads(cls, data: bytes) -> "MemberProfile":
+        """Create from JSON bytes produced by dumps()."""
+        return cls.from_dict(_json_loads(data))
+
+
+@dataclass(slots=True)
 class ProfileSummary:
     """Lightweight summary for index."""
 
@@ -134,9 +376,14 @@ class ProfileSummary:
     first_seen: str  # ISO date (YYYY-MM-DD)
     last_updated: str  # ISO date (YYYY-MM-DD)
     keywords: List[str] = field(default_factory=list)
+    # Derived for case-insensitive name search; not persisted
+    display_name_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.display_name_lc = self.display_name.lower()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for YAML serialization."""
+        """Convert to dictionary for serialization."""
         return {
             "display_name": self.display_name,
             "first_seen": self.first_seen,
@@ -148,7 +395,7 @@ class ProfileSummary:
     def from_dict(cls, member_id: str, data: Dict[str, Any]) -> "ProfileSummary":
         """Create from dictionary."""
         return cls(
-            member_id=member_id,
+            member_id=sys.intern(member_id),
             display_name=data["display_name"],
             first_seen=data["first_seen"],
             last_updated=data["last_updated"],
@@ -156,7 +403,7 @@ class ProfileSummary:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result from a profile search."""
 
@@ -173,6 +420,14 @@ def validate_profile(profile: MemberProfile) -> None:
     Raises:
         ValueError: If validation fails
     """
+    _validate_profile_fields(profile)
+    for i, obs in enumerate(profile.observations):
+        _validate_observation(i, obs)
+    _validate_profile_limits(profile)
+
+
+def _validate_profile_fields(profile: MemberProfile) -> None:
+    """Check VR-001 through VR-004 (everything before per-observation rules)."""
     # VR-001: member_id must be non-empty
     if not profile.member_id or not profile.member_id.strip():
         raise ValueError("member_id must be non-empty (VR-001)")
@@ -197,15 +452,20 @@ def validate_profile(profile: MemberProfile) -> None:
             f"observations must have max {MAX_OBSERVATIONS} items (VR-004)"
         )
 
+
+def _validate_observation(i: int, obs: Observation) -> None:
+    """Check VR-005 for the observation at position i."""
     # VR-005: each observation.text must be non-empty and max 500 chars
-    for i, obs in enumerate(profile.observations):
-        if not obs.text or not obs.text.strip():
-            raise ValueError(f"observation[{i}].text must be non-empty (VR-005)")
-        if len(obs.text) > MAX_OBSERVATION_LENGTH:
-            raise ValueError(
-                f"observation[{i}].text must be max {MAX_OBSERVATION_LENGTH} chars (VR-005)"
-            )
+    if not obs.text or not obs.text.strip():
+        raise ValueError(f"observation[{i}].text must be non-empty (VR-005)")
+    if len(obs.text) > MAX_OBSERVATION_LENGTH:
+        raise ValueError(
+            f"observation[{i}].text must be max {MAX_OBSERVATION_LENGTH} chars (VR-005)"
+        )
 
+
+def _validate_profile_limits(profile: MemberProfile) -> None:
+    """Check VR-006 and VR-007."""
     # VR-006: keywords max 10 items
     if len(profile.keywords) > MAX_KEYWORDS:
         raise ValueError(f"keywords must have max {MAX_KEYWORDS} items (VR-006)")
@@ -215,6 +475,49 @@ def validate_profile(profile: MemberProfile) -> None:
         raise ValueError(f"notes must be max {MAX_NOTES_LENGTH} chars (VR-007)")
 
 
+def _profile_fingerprint(
+    profile: MemberProfile, observations: Optional[List[Dict[str, Any]]] = None
+) -> int:
+    """Hash of a profile's persisted content, excluding last_updated.
+
+    Used by ProfileStore.save to detect saves that wouldn't change the file.
+    Pass the serialized observations if they're already at hand.
+    """
+    if observations is None:
+        observations = [obs.to_dict() for obs in profile.observations]
+    return hash((
+        profile.member_id,
+        profile.platform,
+        profile.display_name,
+        profile.first_seen,
+        tuple((obs["timestamp"], obs["text"]) for obs in observations),
+        profile.notes,
+        tuple(profile.keywords),
+    ))
+
+
+def _parse_profile_summary(profile_path: Path) -> tuple:
+    """Read one profile file and summarize it for the index.
+
+    Module-level so rebuild_index can hand it to worker processes.
+
+    Returns:
+        (profile_path, ProfileSummary or None, error message or None)
+    """
+    try:
+        profile = ProfileStore._read_profile(profile_path)
+        summary = ProfileSummary(
+            member_id=profile.member_id,
+            display_name=profile.display_name,
+            first_seen=_format_day(profile.first_seen.date()),
+            last_updated=_format_day(profile.last_updated.date()),
+            keywords=profile.keywords[:MAX_KEYWORDS],
+        )
+    except Exception as e:
+        return profile_path, None, str(e)
+    return profile_path, summary, None
+
+
 # === Factory Function ===
 
 
@@ -256,7 +559,7 @@ def create_profile(
 class ProfileStore:
     """Storage system for member profiles.
 
-    Stores profiles as YAML files with an index for fast lookup.
+    Stores profiles as JSON files with an index for fast lookup.
 
     Usage:
         store = ProfileStore(base_dir=Path("./profiles"))
@@ -287,7 +590,25 @@ class ProfileStore:
             base_dir = root / "profiles"
 
         self.base_dir = Path(base_dir)
+        # Platform directories already created by _ensure_platform_dir
+        self._platform_dirs: Dict[str, Path] = {}
         self._index_cache: Dict[str, Dict[str, ProfileSummary]] = {}
+        # Stamp of the index file each cached index was loaded from or saved to
+        self._index_stamps: Dict[str, Optional[tuple]] = {}
+        # Inverted keyword index per platform: keyword -> member_ids
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}
+        # Per platform, ascending (last_updated, -index position, member_id)
+        # keys so list_all can slice instead of sorting, plus each member's key
+        self._recency: Dict[str, List[tuple]] = {}
+        self._recency_keys: Dict[str, Dict[str, tuple]] = {}
+        # Per platform, lowercased display names packed for search(); built
+        # lazily and dropped when a name or the member set changes
+        self._name_tables: Dict[str, tuple] = {}
+        # Index writes deferred while inside batch()
+        self._batching = False
+        self._dirty_platforms: Set[str] = set()
+        # (platform, member_id) -> ((suffix, mtime_ns, size), profile, fingerprint)
+        self._profile_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
 
     def _ensure_platform_dir(self, platform: str) -> Path:
         """Create platform directory if it doesn't exist.
@@ -298,11 +619,17 @@ class ProfileStore:
         Returns:
             Path to platform directory
         """
+        # mkdir once per platform per store, not on every path lookup
+        platform_dir = self._platform_dirs.get(platform)
+        if platform_dir is not None:
+            return platform_dir
+
         if platform not in SUPPORTED_PLATFORMS:
             raise ValueError(f"Unsupported platform: {platform}")
 
         platform_dir = self.base_dir / platform
         platform_dir.mkdir(parents=True, exist_ok=True)
+        self._platform_dirs[platform] = platform_dir
         return platform_dir
 
     def _get_profile_path(self, platform: str, member_id: str) -> Path:
@@ -313,11 +640,26 @@ class ProfileStore:
             member_id: Member ID
 
         Returns:
-            Path to profile YAML file
+            Path to profile JSON file
         """
         platform_dir = self._ensure_platform_dir(platform)
+        return platform_dir / f"{member_id}.json"
+
+    def _get_legacy_profile_path(self, platform: str, member_id: str) -> Path:
+        """Get path to a profile file written in the old YAML format."""
+        platform_dir = self._ensure_platform_dir(platform)
         return platform_dir / f"{member_id}.yaml"
 
+    @staticmethod
+    def _read_profile(profile_path: Path) -> MemberProfile:
+        """Load a profile file, JSON or legacy YAML by suffix."""
+        if profile_path.suffix == ".json":
+            return MemberProfile.loads(profile_path.read_bytes())
+
+        yaml, loader, _ = _yaml_backend()
+        data = yaml.load(profile_path.read_bytes(), Loader=loader)
+        return MemberProfile.from_dict(data)
+
     def _get_index_path(self, platform: str) -> Path:
         """Get path to index file.
 
@@ -325,9 +667,14 @@ class ProfileStore:
             platform: Platform identifier
 
         Returns:
-            Path to index YAML file
+            Path to index JSON file
         """
         platform_dir = self._ensure_platform_dir(platform)
+        return platform_dir / "index.json"
+
+    def _get_legacy_index_path(self, platform: str) -> Path:
+        """Get path to an index file written in the old YAML format."""
+        platform_dir = self._ensure_platform_dir(platform)
         return platform_dir / "index.yaml"
 
     def _load_index(self, platform: str) -> Dict[str, ProfileSummary]:
@@ -339,40 +686,91 @@ class ProfileStore:
         Returns:
             Dictionary mapping member_id to ProfileSummary
         """
-        # Check cache first
+        # Check cache first; unsaved batch edits always win, otherwise the
+        # cache is good while the file is unchanged since we last touched it
         if platform in self._index_cache:
+            if platform in self._dirty_platforms:
+                return self._index_cache[platform]
+            stamp = self._index_stamp(platform)
+            if stamp == self._index_stamps.get(platform):
+                return self._index_cache[platform]
+        else:
+            stamp = self._index_stamp(platform)
+
+        self._index_stamps[platform] = stamp
+        if stamp is None:
+            self._set_index_cache(platform, {})
             return self._index_cache[platform]
 
-        index_path = self._get_index_path(platform)
-
-        if not index_path.exists():
-            self._index_cache[platform] = {}
-            return {}
-
-        with open(index_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        if stamp[0] == ".json":
+            data = _json_loads(self._get_index_path(platform).read_bytes()) or {}
+        else:
+            # Legacy YAML index; converted to JSON on the next save
+            yaml, loader, _ = _yaml_backend()
+            legacy_path = self._get_legacy_index_path(platform)
+            data = yaml.load(legacy_path.read_bytes(), Loader=loader) or {}
 
         members = data.get("members", {})
-        index = {
-            member_id: ProfileSummary.from_dict(member_id, summary)
-            for member_id, summary in members.items()
-        }
+        index = {}
+        for member_id, summary in members.items():
+            summary = ProfileSummary.from_dict(str(member_id), summary)
+            index[summary.member_id] = summary
 
-        self._index_cache[platform] = index
+        self._set_index_cache(platform, index)
         return index
 
-    def _save_index(self, platform: str, index: Dict[str, ProfileSummary]) -> None:
+    def _index_stamp(self, platform: str) -> Optional[tuple]:
+        """Return (suffix, mtime_ns, size) of the platform's index file.
+
+        Returns:
+            Stamp of index.json, else of a legacy index.yaml, else None
+        """
+        paths = (self._get_index_path(platform), self._get_legacy_index_path(platform))
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            return (path.suffix, st.st_mtime_ns, st.st_size)
+        return None
+
+    def _set_index_cache(self, platform: str, index: Dict[str, ProfileSummary]) -> None:
+        """Cache an index and derive its keyword postings.
+
+        Postings and the recency order are rebuilt from the summaries rather
+        than persisted, so the index file keeps its format and can't drift
+        out of sync with them.
+        """
+        postings: Dict[str, Set[str]] = {}
+        recency_keys: Dict[str, tuple] = {}
+        for position, (member_id, summary) in enumerate(index.items()):
+            for kw in summary.keywords:
+                postings.setdefault(kw, set()).add(member_id)
+            recency_keys[member_id] = (summary.last_updated, -position, member_id)
+        self._index_cache[platform] = index
+        self._postings[platform] = postings
+        self._recency[platform] = sorted(recency_keys.values())
+        self._recency_keys[platform] = recency_keys
+        self._name_tables.pop(platform, None)
+
+    def _save_index(
+        self,
+        platform: str,
+        index: Dict[str, ProfileSummary],
+        now: Optional[datetime] = None,
+    ) -> None:
         """Save index to file with atomic write.
 
         Args:
             platform: Platform identifier
             index: Index to save
+            now: Timestamp for updated_at (default: current time)
         """
         index_path = self._get_index_path(platform)
 
         data = {
             "version": INDEX_VERSION,
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": (now or datetime.now()).isoformat(),
             "count": len(index),
             "members": {
                 member_id: summary.to_dict() for member_id, summary in index.items()
@@ -380,19 +778,17 @@ class ProfileStore:
         }
 
         # Atomic write: write to temp file then rename
-        platform_dir = self._ensure_platform_dir(platform)
-        fd, temp_path = tempfile.mkstemp(dir=platform_dir, suffix=".yaml")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
-            os.replace(temp_path, index_path)
-        except Exception:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
-
-        # Update cache
-        self._index_cache[platform] = index
+        _write_atomic(index_path, _json_dumps(data))
+
+        # The JSON index supersedes one left by an older version
+        legacy_path = self._get_legacy_index_path(platform)
+        if legacy_path.exists():
+            legacy_path.unlink()
+        self._index_stamps[platform] = self._index_stamp(platform)
+
+        # Update cache (save() keeps postings current for the cached index)
+        if self._index_cache.get(platform) is not index:
+            self._set_index_cache(platform, index)
 
     def _trim_observations(self, profile: MemberProfile) -> None:
         """Trim observations to max limit (removes oldest).
@@ -405,6 +801,30 @@ class ProfileStore:
             profile.observations.sort(key=lambda o: o.timestamp, reverse=True)
             profile.observations = profile.observations[:MAX_OBSERVATIONS]
 
+    def _prepare_for_save(self, profile: MemberProfile) -> List[Dict[str, Any]]:
+        """Validate, trim and fill in keywords, walking observations once.
+
+        Raises the same errors, in the same order, as validate_profile.
+
+        Returns:
+            The serialized observations, for to_dict()/dumps()
+        """
+        _validate_profile_fields(profile)
+        self._trim_observations(profile)
+
+        obs_dicts: List[Dict[str, Any]] = []
+        texts: List[str] = []
+        for i, obs in enumerate(profile.observations):
+            _validate_observation(i, obs)
+            obs_dicts.append(obs.to_dict())
+            texts.append(obs.text)
+
+        _validate_profile_limits(profile)
+
+        if not profile.keywords:
+            profile.keywords = self._keywords_from_texts(texts, profile.notes)
+        return obs_dicts
+
     def _extract_keywords(self, profile: MemberProfile) -> List[str]:
         """Extract keywords from profile for indexing.
 
@@ -419,137 +839,28 @@ class ProfileStore:
             return profile.keywords[:MAX_KEYWORDS]
 
         # Otherwise extract from observations and notes
-        words: Dict[str, int] = {}
-        stopwords = {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "need",
-            "dare",
-            "ought",
-            "used",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "at",
-            "by",
-            "from",
-            "as",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "between",
-            "under",
-            "again",
-            "further",
-            "then",
-            "once",
-            "and",
-            "but",
-            "or",
-            "nor",
-            "so",
-            "yet",
-            "both",
-            "either",
-            "neither",
-            "not",
-            "only",
-            "own",
-            "same",
-            "than",
-            "too",
-            "very",
-            "just",
-            "i",
-            "me",
-            "my",
-            "myself",
-            "we",
-            "our",
-            "ours",
-            "ourselves",
-            "you",
-            "your",
-            "yours",
-            "yourself",
-            "yourselves",
-            "he",
-            "him",
-            "his",
-            "himself",
-            "she",
-            "her",
-            "hers",
-            "herself",
-            "it",
-            "its",
-            "itself",
-            "they",
-            "them",
-            "their",
-            "theirs",
-            "themselves",
-            "what",
-            "which",
-            "who",
-            "whom",
-            "this",
-            "that",
-            "these",
-            "those",
-            "am",
-        }
+        return self._keywords_from_texts(
+            [obs.text for obs in profile.observations], profile.notes
+        )
 
-        # Collect text from observations and notes
-        texts = [obs.text for obs in profile.observations]
-        if profile.notes:
-            texts.append(profile.notes)
+    @staticmethod
+    def _keywords_from_texts(texts: List[str], notes: str) -> List[str]:
+        """Pick the most frequent non-stopwords from observation texts and notes."""
+        if notes:
+            texts.append(notes)
 
-        for text in texts:
-            # Simple tokenization
-            for word in text.lower().split():
-                # Clean word
-                word = "".join(c for c in word if c.isalnum())
-                if word and len(word) > 2 and word not in stopwords:
-                    words[word] = words.get(word, 0) + 1
+        # Strip punctuation from the whole text in one regex pass, then split
+        cleaned = _KEYWORD_STRIP_RE.sub("", " ".join(texts).lower())
+        words = Counter(
+            word for word in cleaned.split() if len(word) > 2 and word not in _STOPWORDS
+        )
 
-        # Sort by frequency and return top keywords
-        sorted_words = sorted(words.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:MAX_KEYWORDS]]
+        # Top keywords by frequency (heap-based; ties keep first-seen order)
+        return [word for word, _ in words.most_common(MAX_KEYWORDS)]
 
     # === Core Operations (FR-001, FR-002) ===
 
-    def save(self, profile: MemberProfile) -> None:
+    def save(self, profile: MemberProfile, now: Optional[datetime] = None) -> None:
         """Save or update a member profile.
 
         Creates a new profile if one doesn't exist for the member_id,
@@ -558,53 +869,165 @@ class ProfileStore:
         - Trims observations to max 50 (removes oldest)
         - Updates the platform index
 
+        Saving a profile whose content matches the file on disk is a no-op.
+
         Args:
             profile: The profile to save
+            now: Timestamp for last_updated (default: current time)
 
         Raises:
             ValueError: If profile fails validation
             IOError: If write fails
         """
-        # Validate
-        validate_profile(profile)
+        cache_key = (profile.platform, profile.member_id)
+        # Drop the cached copy up front so a failed save can't leave an
+        # in-memory edit masquerading as the on-disk profile
+        cached = self._profile_cache.pop(cache_key, None)
 
-        # Trim observations
-        self._trim_observations(profile)
+        # Validate, serialize observations and extract keywords (if not
+        # set) in one pass over the observations
+        obs_dicts = self._prepare_for_save(profile)
+        profile._search_blob = None
+
+        profile_path = self._get_profile_path(profile.platform, profile.member_id)
+
+        # Skip the rewrite (and index update) if nothing changed since the
+        # profile was loaded or last saved, and the file is still that version
+        fingerprint = _profile_fingerprint(profile, obs_dicts)
+        if cached is not None and cached[2] == fingerprint:
+            try:
+                st = profile_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is not None and cached[0] == (".json", st.st_mtime_ns, st.st_size):
+                self._cache_profile(cache_key, cached[0], profile, fingerprint)
+                return
 
         # Update timestamp
-        profile.last_updated = datetime.now()
+        if now is None:
+            now = datetime.now()
+        profile.last_updated = now
 
-        # Extract keywords if not set
-        if not profile.keywords:
-            profile.keywords = self._extract_keywords(profile)
+        # Write profile file (atomic)
+        _write_atomic(profile_path, profile.dumps(obs_dicts))
 
-        # Write profile file
-        profile_path = self._get_profile_path(profile.platform, profile.member_id)
-        platform_dir = self._ensure_platform_dir(profile.platform)
+        st = profile_path.stat()
+        self._cache_profile(
+            cache_key, (".json", st.st_mtime_ns, st.st_size), profile, fingerprint
+        )
 
-        # Atomic write
-        fd, temp_path = tempfile.mkstemp(dir=platform_dir, suffix=".yaml")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    profile.to_dict(), f, default_flow_style=False, allow_unicode=True
-                )
-            os.replace(temp_path, profile_path)
-        except Exception:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+        # The JSON file supersedes any YAML copy from older versions
+        legacy_path = self._get_legacy_profile_path(profile.platform, profile.member_id)
+        if legacy_path.exists():
+            legacy_path.unlink()
 
         # Update index
         index = self._load_index(profile.platform)
-        index[profile.member_id] = ProfileSummary(
+        summary = ProfileSummary(
             member_id=profile.member_id,
             display_name=profile.display_name,
-            first_seen=profile.first_seen.strftime("%Y-%m-%d"),
-            last_updated=profile.last_updated.strftime("%Y-%m-%d"),
+            first_seen=_format_day(profile.first_seen.date()),
+            last_updated=_format_day(now.date()),
             keywords=profile.keywords[:MAX_KEYWORDS],
         )
-        self._save_index(profile.platform, index)
+        old_summary = index.get(profile.member_id)
+        if old_summary is None or old_summary.display_name != summary.display_name:
+            self._name_tables.pop(profile.platform, None)
+        self._update_postings(profile.platform, old_summary, summary)
+        self._update_recency(profile.platform, summary)
+        index[profile.member_id] = summary
+        if self._batching:
+            self._dirty_platforms.add(profile.platform)
+        else:
+            self._save_index(profile.platform, index, now)
+
+    @contextmanager
+    def batch(self) -> Iterator["ProfileStore"]:
+        """Defer index writes until the block exits.
+
+        Profile files are still written by each save(); only the index,
+        which would otherwise be rewritten in full per save, is batched.
+
+        Usage:
+            with store.batch():
+                for profile in profiles:
+                    store.save(profile)
+        """
+        if self._batching:
+            # Nested batch: the outermost one flushes
+            yield self
+            return
+
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any index changes deferred by batch()."""
+        for platform in sorted(self._dirty_platforms):
+            self._save_index(platform, self._index_cache[platform])
+        self._dirty_platforms.clear()
+
+    def _update_postings(
+        self, platform: str, old: Optional[ProfileSummary], new: ProfileSummary
+    ) -> None:
+        """Move a member's postings from its old keywords to its new ones."""
+        postings = self._postings[platform]
+        member_id = new.member_id
+        if old is not None:
+            for kw in old.keywords:
+                members = postings.get(kw)
+                if members is not None:
+                    members.discard(member_id)
+                    if not members:
+                        del postings[kw]
+        for kw in new.keywords:
+            postings.setdefault(kw, set()).add(member_id)
+
+    def _name_table(self, platform: str) -> tuple:
+        """Return the platform's display names packed for substring search.
+
+        Returns:
+            (member_ids, name_starts, names_blob, positions): names_blob holds
+            every lowercased display name in index order, NUL-separated, with
+            name i starting at name_starts[i]; positions maps member_id -> i
+        """
+        table = self._name_tables.get(platform)
+        if table is None:
+            index = self._index_cache[platform]
+            member_ids = list(index)
+            name_starts = []
+            offset = 0
+            for summary in index.values():
+                name_starts.append(offset)
+                offset += len(summary.display_name_lc) + 1
+            names_blob = "\0".join(s.display_name_lc for s in index.values())
+            positions = {member_id: row for row, member_id in enumerate(member_ids)}
+            table = (member_ids, name_starts, names_blob, positions)
+            self._name_tables[platform] = table
+        return table
+
+    def _update_recency(self, platform: str, summary: ProfileSummary) -> None:
+        """Move a member to its new last_updated slot in the recency order.
+
+        Members keep their index position, so ties still list in the order
+        the index holds them.
+        """
+        recency = self._recency[platform]
+        recency_keys = self._recency_keys[platform]
+        member_id = summary.member_id
+        old_key = recency_keys.get(member_id)
+        if old_key is not None:
+            del recency[bisect.bisect_left(recency, old_key)]
+            position = old_key[1]
+        else:
+            position = -len(recency_keys)  # Appended to the end of the index
+        new_key = (summary.last_updated, position, member_id)
+        bisect.insort(recency, new_key)
+        recency_keys[member_id] = new_key
 
     def get(self, platform: str, member_id: str) -> Optional[MemberProfile]:
         """Retrieve a member's profile by ID.
@@ -615,19 +1038,42 @@ class ProfileStore:
 
         Returns:
             MemberProfile if found, None if not exists
+
+        Profiles are cached while their file is unchanged, so repeated
+        calls return the same object; call save() after modifying it.
         """
         if platform not in SUPPORTED_PLATFORMS:
             raise ValueError(f"Unsupported platform: {platform}")
 
         profile_path = self._get_profile_path(platform, member_id)
+        try:
+            st = profile_path.stat()
+        except FileNotFoundError:
+            profile_path = self._get_legacy_profile_path(platform, member_id)
+            try:
+                st = profile_path.stat()
+            except FileNotFoundError:
+                return None
+
+        key = (platform, member_id)
+        stamp = (profile_path.suffix, st.st_mtime_ns, st.st_size)
+        cached = self._profile_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            self._profile_cache.move_to_end(key)
+            return cached[1]
+
+        profile = self._read_profile(profile_path)
+        self._cache_profile(key, stamp, profile, _profile_fingerprint(profile))
+        return profile
 
-        if not profile_path.exists():
-            return None
-
-        with open(profile_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        return MemberProfile.from_dict(data)
+    def _cache_profile(
+        self, key: tuple, stamp: tuple, profile: MemberProfile, fingerprint: int
+    ) -> None:
+        """Remember a profile, the file stamp it matches, and its content hash."""
+        self._profile_cache[key] = (stamp, profile, fingerprint)
+        self._profile_cache.move_to_end(key)
+        if len(self._profile_cache) > PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
 
     def exists(self, platform: str, member_id: str) -> bool:
         """Check if a profile exists without loading it.
@@ -676,17 +1122,49 @@ class ProfileStore:
         index = self._load_index(platform)
         matched_ids = set()
 
-        for member_id, summary in index.items():
+        # Match query terms against the keyword vocabulary once, then pull
+        # candidate members from the postings instead of testing every
+        # keyword of every member
+        postings = self._postings[platform]
+        if query_terms:
+            # One alternation scans each keyword for every term in a single pass
+            terms_re = re.compile("|".join(map(re.escape, query_terms)))
+            hit_keywords = {kw for kw in postings if terms_re.search(kw)}
+        else:
+            hit_keywords = set()
+        # Find name matches with str.find over all names at once, then visit
+        # only name or keyword candidates, in index order
+        member_ids, name_starts, names_blob, positions = self._name_table(platform)
+        name_hits: Set[int] = set()
+        if query_lower:
+            pos = names_blob.find(query_lower)
+            while pos >= 0:
+                row = bisect.bisect_right(name_starts, pos) - 1
+                name_hits.add(row)
+                if row + 1 == len(name_starts):
+                    break
+                pos = names_blob.find(query_lower, name_starts[row + 1])
+        else:
+            name_hits.update(range(len(member_ids)))
+
+        candidate_rows = set(name_hits)
+        for kw in hit_keywords:
+            candidate_rows.update(positions[member_id] for member_id in postings[kw])
+
+        for row in sorted(candidate_rows):
+            if len(results) >= limit:
+                break
+
+            member_id = member_ids[row]
+            summary = index[member_id]
             match_reasons = []
 
             # Check display name
-            if query_lower in summary.display_name.lower():
+            if row in name_hits:
                 match_reasons.append(f"name contains '{query}'")
 
             # Check keywords
-            matching_keywords = [
-                kw for kw in summary.keywords if any(term in kw for term in query_terms)
-            ]
+            matching_keywords = [kw for kw in summary.keywords if kw in hit_keywords]
             if matching_keywords:
                 match_reasons.append(f"keywords: {', '.join(matching_keywords)}")
 
@@ -698,9 +1176,6 @@ class ProfileStore:
                     )
                     matched_ids.add(member_id)
 
-            if len(results) >= limit:
-                break
-
         # Second pass: deep search observations/notes if needed
         if len(results) < limit:
             for member_id in index.keys():
@@ -711,16 +1186,20 @@ class ProfileStore:
                 if not profile:
                     continue
 
+                # One scan over observations and notes; most profiles miss
+                blob, notes_start = profile.search_text()
+                pos = blob.find(query_lower)
+                if pos < 0:
+                    continue
+
                 match_reasons = []
 
                 # Check observations
-                for obs in profile.observations:
-                    if query_lower in obs.text.lower():
-                        match_reasons.append(f"observation mentions '{query}'")
-                        break
+                if pos < notes_start:
+                    match_reasons.append(f"observation mentions '{query}'")
 
                 # Check notes
-                if profile.notes and query_lower in profile.notes.lower():
+                if pos >= notes_start or blob.find(query_lower, notes_start) >= 0:
                     match_reasons.append(f"notes contain '{query}'")
 
                 if match_reasons:
@@ -753,12 +1232,11 @@ class ProfileStore:
 
         index = self._load_index(platform)
 
-        # Sort by last_updated descending
-        summaries = sorted(
-            index.values(), key=lambda s: s.last_updated, reverse=True
-        )
-
-        return summaries[offset : offset + limit]
+        # Newest last_updated first: walk the ascending recency keys backwards
+        recency = self._recency[platform]
+        end = max(len(recency) - max(offset, 0), 0)
+        start = max(end - max(limit, 0), 0)
+        return [index[key[2]] for key in reversed(recency[start:end])]
 
     def count(self, platform: str) -> int:
         """Get total number of profiles for a platform.
@@ -810,13 +1288,12 @@ class ProfileStore:
                 raise ValueError("display_name required when creating new profile")
             profile = create_profile(platform, member_id, display_name)
 
-        # Add observation
-        profile.observations.append(
-            Observation(timestamp=datetime.now(), text=text)
-        )
+        # Add observation; the save stamps last_updated with the same time
+        now = datetime.now()
+        profile.observations.append(Observation(timestamp=now, text=text))
 
         # Save (handles trimming and index update)
-        self.save(profile)
+        self.save(profile, now=now)
 
         return profile
 
@@ -839,26 +1316,43 @@ class ProfileStore:
         platform_dir = self._ensure_platform_dir(platform)
         index: Dict[str, ProfileSummary] = {}
 
-        # Scan all YAML files (except index.yaml)
-        for profile_path in platform_dir.glob("*.yaml"):
-            if profile_path.name == "index.yaml":
-                continue
-
+        # One directory listing; legacy YAML profiles go first so JSON copies
+        # take precedence
+        yaml_paths: List[Path] = []
+        json_paths: List[Path] = []
+        with os.scandir(platform_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or not entry.is_file():
+                    continue
+                if name.endswith(".json"):
+                    if name != "index.json":
+                        json_paths.append(platform_dir / name)
+                elif name.endswith(".yaml") and name != "index.yaml":
+                    yaml_paths.append(platform_dir / name)
+        profile_paths = yaml_paths + json_paths
+
+        results = None
+        # A pool only pays off with more than one CPU to spread work over
+        if (len(profile_paths) >= PARALLEL_REBUILD_MIN_FILES
+                and (os.cpu_count() or 1) > 1):
             try:
-                with open(profile_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-
-                profile = MemberProfile.from_dict(data)
-                index[profile.member_id] = ProfileSummary(
-                    member_id=profile.member_id,
-                    display_name=profile.display_name,
-                    first_seen=profile.first_seen.strftime("%Y-%m-%d"),
-                    last_updated=profile.last_updated.strftime("%Y-%m-%d"),
-                    keywords=profile.keywords[:MAX_KEYWORDS],
-                )
-            except Exception as e:
+                with ProcessPoolExecutor() as executor:
+                    # map() keeps input order, so JSON still wins over YAML
+                    results = list(executor.map(
+                        _parse_profile_summary, profile_paths, chunksize=32
+                    ))
+            except (OSError, BrokenProcessPool):
+                results = None  # No worker processes here; parse serially
+        if results is None:
+            results = map(_parse_profile_summary, profile_paths)
+
+        for profile_path, summary, error in results:
+            if summary is None:
                 # Log but continue rebuilding
-                print(f"Warning: Failed to index {profile_path}: {e}")
+                print(f"Warning: Failed to index {profile_path}: {error}")
+                continue
+            index[summary.member_id] = summary
 
         self._save_index(platform, index)
         return len(index)
@@ -4,69 +4,123 @@ Provides persona presets and custom persona builder for community agents.
 Personas define how the bot presents itself (name, role, personality, tasks).
 """
 
+import io
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 
-@dataclass
+# Optional sections are empty or start with their own blank-line separator
+_PROMPT_TEMPLATE = (
+    "You are {name}, a {role}.\nPersonality: {personality}"
+    "{tasks_section}{style_section}{background_section}"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class BotPersona:
-    """Complete bot persona configuration."""
+    """Complete bot persona configuration.
+
+    Frozen (and hashable) so presets can be shared safely and the rendered
+    prompt can be cached on the instance.
+    """
 
     name: str                           # Bot's display name (e.g., "Luna", "Alex")
     role: str                           # Job title/role (e.g., "Community Manager")
     personality: str                    # Personality description
-    tasks: list[str] = field(default_factory=list)  # What the bot does
+    tasks: tuple[str, ...] = ()         # What the bot does
     communication_style: str = ""       # How the bot communicates
     background: str = ""                # Optional backstory/context
     preset: str = "custom"              # Which preset this is based on
+    _prompt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _mapping: Optional[Mapping] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def as_mapping(self) -> Mapping:
+        """Read-only view of the config fields, built once per persona.
+
+        Shared between callers, so tasks stays a tuple; use to_dict() for a
+        copy that can be stored or edited.
+        """
+        if self._mapping is None:
+            object.__setattr__(self, "_mapping", MappingProxyType({
+                "preset": self.preset,
+                "name": self.name,
+                "role": self.role,
+                "personality": self.personality,
+                "tasks": self.tasks,
+                "communication_style": self.communication_style,
+                "background": self.background,
+            }))
+        return self._mapping
 
     def to_dict(self) -> dict:
         """Convert to dictionary for config storage."""
-        return {
-            "preset": self.preset,
-            "name": self.name,
-            "role": self.role,
-            "personality": self.personality,
-            "tasks": self.tasks,
-            "communication_style": self.communication_style,
-            "background": self.background,
-        }
+        # A fresh dict (and tasks list) each time: config keeps and edits it
+        return {**self.as_mapping(), "tasks": list(self.tasks)}
 
     @classmethod
     def from_dict(cls, data: dict) -> "BotPersona":
-        """Create from dictionary."""
-        return cls(
+        """Create from dictionary.
+
+        Data matching a preset returns that shared preset instance, along
+        with its already-rendered prompt.
+        """
+        persona = cls(
             preset=data.get("preset", "custom"),
             name=data.get("name", ""),
             role=data.get("role", ""),
             personality=data.get("personality", ""),
-            tasks=data.get("tasks", []),
+            tasks=tuple(data.get("tasks") or ()),
             communication_style=data.get("communication_style", ""),
             background=data.get("background", ""),
         )
+        if cls is BotPersona:
+            try:
+                return _CANONICAL_PERSONAS.get(persona, persona)
+            except TypeError:
+                # Hand-edited configs may hold unhashable task entries
+                return persona
+        return persona
 
     def to_prompt(self) -> str:
         """Generate LLM prompt segment from persona."""
-        lines = [
-            f"You are {self.name}, a {self.role}.",
-            f"Personality: {self.personality}",
-            "",
-        ]
-
-        if self.tasks:
-            lines.append("Your responsibilities:")
-            for task in self.tasks:
-                lines.append(f"- {task}")
-            lines.append("")
-
-        if self.communication_style:
-            lines.append(f"Communication style: {self.communication_style}")
-            lines.append("")
-
-        if self.background:
-            lines.append(f"Background: {self.background}")
+        return self.prompt
+
+    @property
+    def prompt(self) -> str:
+        """LLM prompt segment, rendered on first use."""
+        if self._prompt is None:
+            object.__setattr__(self, "_prompt", self._render_prompt())
+        return self._prompt
+
+    def _render_prompt(self) -> str:
+        """Build the prompt text for this persona."""
+        tasks_section = (
+            "\n\nYour responsibilities:\n" + "\n".join([f"- {task}" for task in self.tasks])
+            if self.tasks
+            else ""
+        )
+        style_section = (
+            f"\n\nCommunication style: {self.communication_style}"
+            if self.communication_style
+            else ""
+        )
+        background_section = f"\n\nBackground: {self.background}" if self.background else ""
 
-        return "\n".join(lines).strip()
+        # Trailing whitespace from the last value is dropped, as before
+        return _PROMPT_TEMPLATE.format_map({
+            "name": self.name,
+            "role": self.role,
+            "personality": self.personality,
+            "tasks_section": tasks_section,
+            "style_section": style_section,
+            "background_section": background_section,
+        }).rstrip()
 
 
 # Preset persona templates
@@ -76,12 +130,12 @@ PERSONA_PRESETS: dict[str, BotPersona] = {
         name="Alex",
         role="Community Manager",
         personality="Professional, organized, and helpful. Keeps discussions on track.",
-        tasks=[
+        tasks=(
             "Welcome new members",
             "Answer community questions",
             "Summarize discussions",
             "Highlight important announcements",
-        ],
+        ),
         communication_style="Clear and professional, uses bullet points for clarity",
         background="Experienced community manager who knows the ins and outs",
     ),
@@ -90,12 +144,12 @@ PERSONA_PRESETS: dict[str, BotPersona] = {
         name="Luna",
         role="Community Helper",
         personality="Warm, encouraging, and patient. Makes everyone feel welcome.",
-        tasks=[
+        tasks=(
             "Help newcomers get started",
             "Answer questions with patience",
             "Celebrate member achievements",
             "Create a welcoming atmosphere",
-        ],
+        ),
         communication_style="Friendly and conversational, uses occasional emoji",
         background="A supportive friend who's always happy to help",
     ),
@@ -104,17 +158,29 @@ PERSONA_PRESETS: dict[str, BotPersona] = {
         name="Dev",
         role="Technical Support",
         personality="Knowledgeable, precise, and thorough. Loves diving into details.",
-        tasks=[
+        tasks=(
             "Answer technical questions",
             "Provide code examples",
             "Debug issues",
             "Share best practices",
-        ],
+        ),
         communication_style="Technical but accessible, includes code snippets",
         background="Senior developer who enjoys teaching",
     ),
 }
 
+# Shared default; presets are immutable, so callers can't alter it
+DEFAULT_PERSONA = PERSONA_PRESETS["community_manager"]
+
+# Snapshots of the (constant) preset table for listing and menu indexing
+PRESET_ITEMS: tuple[tuple[str, BotPersona], ...] = tuple(PERSONA_PRESETS.items())
+PRESET_VALUES: tuple[BotPersona, ...] = tuple(PERSONA_PRESETS.values())
+
+# Personas are hashable by value; maps any equal persona to the preset object
+_CANONICAL_PERSONAS: dict[BotPersona, BotPersona] = {
+    persona: persona for persona in PERSONA_PRESETS.values()
+}
+
 
 # Predefined options for custom persona builder
 PERSONA_OPTIONS = {
@@ -162,46 +228,118 @@ PERSONA_OPTIONS = {
 }
 
 
+def compile_prompt(persona: BotPersona) -> Callable[[], str]:
+    """Specialize a persona into a zero-argument prompt function.
+
+    The prompt is rendered once, up front; the returned function just hands
+    back that string. Callers that keep a persona for a whole session hold
+    the function instead of re-rendering. Since the text is identical on
+    every call, keep it at the very start of LLM requests so providers with
+    prompt caching can reuse it as a cached prefix.
+
+    Args:
+        persona: Persona to render
+
+    Returns:
+        Function returning the persona's prompt text
+    """
+    rendered = persona.to_prompt()
+
+    def prompt() -> str:
+        return rendered
+
+    return prompt
+
+
+@lru_cache(maxsize=64)
 def get_preset(preset_name: str) -> Optional[BotPersona]:
     """Get a persona preset by name.
 
+    Matching ignores case and surrounding whitespace, and treats spaces and
+    hyphens as underscores, so "Community Manager" finds community_manager.
+
     Args:
         preset_name: Name of the preset (community_manager, friendly_helper, tech_expert)
 
     Returns:
         BotPersona instance or None if not found
     """
-    return PERSONA_PRESETS.get(preset_name)
+    key = preset_name.strip().lower().replace(" ", "_").replace("-", "_")
+    return PERSONA_PRESETS.get(key)
 
 
 def get_default_persona() -> BotPersona:
     """Get the default persona (community_manager)."""
-    return PERSONA_PRESETS["community_manager"]
+    return DEFAULT_PERSONA
 
 
-def list_presets() -> list[tuple[str, BotPersona]]:
+def list_presets() -> tuple[tuple[str, BotPersona], ...]:
     """List all available presets.
 
     Returns:
-        List of (preset_id, BotPersona) tuples
+        Tuple of (preset_id, BotPersona) pairs, shared between calls
     """
-    return list(PERSONA_PRESETS.items())
+    return PRESET_ITEMS
+
+
+def _format_preset_menu() -> str:
+    """Format the preset selection menu shown by print_preset_options."""
+    lines = ["Choose a Bot Persona:", "-" * 50]
+
+    for i, persona in enumerate(PERSONA_PRESETS.values(), 1):
+        lines.append(f"  {i}. {persona.name} - {persona.role}")
+        # Show first sentence of personality
+        lines.append(f"     {persona.personality.partition('.')[0]}.")
+        lines.append("")
+
+    lines.append(f"  {len(PERSONA_PRESETS) + 1}. Custom - Create your own persona")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Presets are fixed, so the menu is formatted once at import
+_PRESET_MENU_TEXT = _format_preset_menu()
 
 
 def print_preset_options() -> None:
     """Print available persona presets in a formatted way."""
-    print("Choose a Bot Persona:")
-    print("-" * 50)
+    print(_PRESET_MENU_TEXT)
+
+
+# Numbered option menus, keyed by (options, allow_other); the builder's
+# option lists are fixed, so each menu is formatted once per process
+_MENU_CACHE: dict[tuple[tuple[str, ...], bool], str] = {}
+
+
+def _format_options_menu(options: list[str], allow_other: bool) -> str:
+    """Return the numbered menu for options, one line per option."""
+    key = (tuple(options), allow_other)
+    text = _MENU_CACHE.get(key)
+    if text is None:
+        lines = [f"  {i}. {opt}" for i, opt in enumerate(options, 1)]
+        if allow_other:
+            lines.append(f"  {len(options) + 1}. Other (type your own)")
+        text = _MENU_CACHE[key] = "\n".join(lines)
+    return text
+
 
-    for i, (preset_id, persona) in enumerate(PERSONA_PRESETS.items(), 1):
-        print(f"  {i}. {persona.name} - {persona.role}")
-        # Show first line of personality
-        personality_preview = persona.personality.split(".")[0]
-        print(f"     {personality_preview}.")
-        print()
+# Exactly the strings int() accepts in base 10 (after strip)
+_CHOICE_RE = re.compile(r"[+-]?\d+(?:_\d+)*")
 
-    print(f"  {len(PERSONA_PRESETS) + 1}. Custom - Create your own persona")
-    print()
+
+def _parse_choice(text: str) -> Optional[int]:
+    """Parse a 1-based menu choice into a 0-based index.
+
+    Returns:
+        The index, or None if text isn't a number (i.e. custom input)
+    """
+    # Screen with the regex so custom text doesn't cost a ValueError
+    if not _CHOICE_RE.fullmatch(text):
+        return None
+    try:
+        return int(text) - 1
+    except ValueError:
+        return None  # Longer than int()'s digit limit
 
 
 def prompt_with_options_single(
@@ -219,15 +357,12 @@ def prompt_with_options_single(
     Returns:
         Selected value
     """
-    print(f"\n{prompt}")
-
-    for i, opt in enumerate(options, 1):
-        print(f"  {i}. {opt}")
-
-    if allow_other:
-        print(f"  {len(options) + 1}. Other (type your own)")
-
-    print(f"\nEnter choice [1-{len(options) + (1 if allow_other else 0)}]: ", end="")
+    # Question, menu and input prompt go out in one write
+    sys.stdout.write(
+        f"\n{prompt}\n{_format_options_menu(options, allow_other)}\n"
+        f"\nEnter choice [1-{len(options) + (1 if allow_other else 0)}]: "
+    )
+    sys.stdout.flush()
 
     try:
         user_input = input().strip()
@@ -235,15 +370,13 @@ def prompt_with_options_single(
         # Non-interactive, return first option
         return options[0]
 
-    try:
-        idx = int(user_input) - 1
+    idx = _parse_choice(user_input)
+    if idx is not None:
         if 0 <= idx < len(options):
             return options[idx]
         elif allow_other and idx == len(options):
             print("Enter custom value: ", end="")
             return input().strip() or options[0]
-    except ValueError:
-        pass
     return options[0]
 
 
@@ -262,15 +395,12 @@ def prompt_with_options_multiple(
     Returns:
         List of selected values
     """
-    print(f"\n{prompt}")
-
-    for i, opt in enumerate(options, 1):
-        print(f"  {i}. {opt}")
-
-    if allow_other:
-        print(f"  {len(options) + 1}. Other (type your own)")
-
-    print("\nEnter choices (comma-separated): ", end="")
+    # Question, menu and input prompt go out in one write
+    sys.stdout.write(
+        f"\n{prompt}\n{_format_options_menu(options, allow_other)}\n"
+        "\nEnter choices (comma-separated): "
+    )
+    sys.stdout.flush()
 
     try:
         user_input = input().strip()
@@ -282,19 +412,18 @@ def prompt_with_options_multiple(
     results = []
     for part in user_input.split(","):
         part = part.strip()
-        try:
-            idx = int(part) - 1
-            if 0 <= idx < len(options):
-                results.append(options[idx])
-            elif allow_other and idx == len(options):
-                print("Enter custom value: ", end="")
-                custom = input().strip()
-                if custom:
-                    results.append(custom)
-        except ValueError:
+        idx = _parse_choice(part)
+        if idx is None:
             # Treat as custom input
             if part:
                 results.append(part)
+        elif 0 <= idx < len(options):
+            results.append(options[idx])
+        elif allow_other and idx == len(options):
+            print("Enter custom value: ", end="")
+            custom = input().strip()
+            if custom:
+                results.append(custom)
     return results if results else options[:1]
 
 
@@ -304,63 +433,75 @@ def build_custom_persona() -> BotPersona:
     Returns:
         BotPersona with user-selected values
     """
-    print("\nCustom Persona Setup")
-    print("-" * 50)
+    # Headings and "> Field: value" echoes are buffered and written in one
+    # go right before the next prompt (or at the end), so output order is
+    # unchanged
+    out = io.StringIO()
+
+    def ask(prompt_fn: Callable, question: str, options: list[str]):
+        sys.stdout.write(out.getvalue())
+        out.seek(0)
+        out.truncate()
+        return prompt_fn(question, options, allow_other=True)
 
-    name = prompt_with_options_single(
+    out.write(f"\nCustom Persona Setup\n{'-' * 50}\n")
+
+    name = ask(
+        prompt_with_options_single,
         "What should the bot be called?",
         PERSONA_OPTIONS["names"],
-        allow_other=True,
     )
-    print(f"> Name: {name}")
+    out.write(f"> Name: {name}\n")
 
-    role = prompt_with_options_single(
+    role = ask(
+        prompt_with_options_single,
         "What's the bot's role?",
         PERSONA_OPTIONS["roles"],
-        allow_other=True,
     )
-    print(f"> Role: {role}")
+    out.write(f"> Role: {role}\n")
 
-    personality = prompt_with_options_single(
+    personality = ask(
+        prompt_with_options_single,
         "What's the bot's personality?",
         PERSONA_OPTIONS["personalities"],
-        allow_other=True,
     )
-    print(f"> Personality: {personality}")
+    out.write(f"> Personality: {personality}\n")
 
-    tasks = prompt_with_options_multiple(
+    tasks = ask(
+        prompt_with_options_multiple,
         "What are the bot's main tasks? (select multiple, comma-separated)",
         PERSONA_OPTIONS["tasks"],
-        allow_other=True,
     )
-    print(f"> Tasks: {', '.join(tasks)}")
+    out.write(f"> Tasks: {', '.join(tasks)}\n")
 
-    communication_style = prompt_with_options_single(
+    communication_style = ask(
+        prompt_with_options_single,
         "How should the bot communicate?",
         PERSONA_OPTIONS["communication_styles"],
-        allow_other=True,
     )
-    print(f"> Style: {communication_style}")
+    out.write(f"> Style: {communication_style}\n")
 
     background_options = PERSONA_OPTIONS["backgrounds"] + ["Skip (no background)"]
-    background = prompt_with_options_single(
+    background = ask(
+        prompt_with_options_single,
         "(Optional) Background context for the bot?",
         background_options,
-        allow_other=True,
     )
     if background == "Skip (no background)":
         background = ""
     else:
-        print(f"> Background: {background}")
+        out.write(f"> Background: {background}\n")
 
-    print(f"\nPersona created: {name} ({role})")
+    out.write(f"\nPersona created: {name} ({role})\n")
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
     return BotPersona(
         preset="custom",
         name=name,
         role=role,
         personality=personality,
-        tasks=tasks,
+        tasks=tuple(tasks),
         communication_style=communication_style,
         background=background,
     )
@@ -374,9 +515,10 @@ def select_persona_interactive() -> BotPersona:
     Returns:
         Selected or created BotPersona
     """
-    print_preset_options()
-
-    print(f"Enter choice [1-{len(PERSONA_PRESETS) + 1}]: ", end="")
+    sys.stdout.write(
+        f"{_PRESET_MENU_TEXT}\nEnter choice [1-{len(PERSONA_PRESETS) + 1}]: "
+    )
+    sys.stdout.flush()
 
     try:
         user_input = input().strip()
@@ -384,21 +526,17 @@ def select_persona_interactive() -> BotPersona:
         # Non-interactive, return default
         return get_default_persona()
 
-    try:
-        choice = int(user_input)
-        preset_list = list(PERSONA_PRESETS.values())
-
-        if 1 <= choice <= len(preset_list):
-            selected = preset_list[choice - 1]
+    idx = _parse_choice(user_input)
+    if idx is not None:
+        if 0 <= idx < len(PRESET_VALUES):
+            selected = PRESET_VALUES[idx]
             print(f"\nSelected: {selected.name} ({selected.role})")
             print(f"  Role: {selected.role}")
-            print(f"  Personality: {selected.personality.split('.')[0]}.")
+            print(f"  Personality: {selected.personality.partition('.')[0]}.")
             print(f"  Style: {selected.communication_style}")
             return selected
-        elif choice == len(preset_list) + 1:
+        elif idx == len(PRESET_VALUES):
             return build_custom_persona()
-    except ValueError:
-        pass
 
     # Default to community_manager
     return get_default_persona()
@@ -20,50 +20,68 @@ Usage:
     print(f"Last extraction: {state.last_extraction}")
 """
 
+import heapq
 import os
 import re
 import sys
-import tempfile
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
-# Add discord-user-connector path for MessageParser
-sys.path.insert(
-    0,
-    str(
-        Path(__file__).parent.parent.parent
-        / "discord-user-connector"
-        / "lib"
-        / "analytics"
-    ),
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+from .member_profile import (
+    ProfileStore,
+    _json_dumps,
+    _json_loads,
+    _write_atomic,
+    create_profile,
 )
 
-try:
+if TYPE_CHECKING:
     from parser import MessageParser, ParsedMessage
-except ImportError:
-    # Fallback for when running from different contexts
-    discord_analytics_path = (
-        Path(__file__).parent.parent.parent
-        / "discord-user-connector"
-        / "lib"
-        / "analytics"
-    )
-    if discord_analytics_path.exists():
-        sys.path.insert(0, str(discord_analytics_path))
-        from parser import MessageParser, ParsedMessage
-    else:
-        raise ImportError(
-            "Could not import MessageParser from discord-user-connector. "
-            "Ensure discord-user-connector plugin is installed."
-        )
 
-from .member_profile import ProfileStore, create_profile
+# MessageParser lives in the discord-user-connector plugin
+DISCORD_ANALYTICS_DIR = (
+    Path(__file__).parent.parent.parent / "discord-user-connector" / "lib" / "analytics"
+)
+_message_parser_class = None
+
+
+def _get_message_parser_class() -> type:
+    """Import MessageParser from discord-user-connector on first use.
+
+    Deferred so importing this module (e.g. for ExtractionState) doesn't
+    touch sys.path or load the parser until messages are actually parsed.
+
+    Raises:
+        ImportError: If discord-user-connector isn't installed
+    """
+    global _message_parser_class
+    if _message_parser_class is None:
+        analytics_path = str(DISCORD_ANALYTICS_DIR)
+        if analytics_path not in sys.path:
+            sys.path.insert(0, analytics_path)
+        try:
+            from parser import MessageParser
+        except ImportError as e:
+            raise ImportError(
+                "Could not import MessageParser from discord-user-connector. "
+                "Ensure discord-user-connector plugin is installed."
+            ) from e
+        _message_parser_class = MessageParser
+    return _message_parser_class
 
 
 # === Constants ===
@@ -72,7 +90,9 @@ MIN_MESSAGES_FOR_PROFILE = 3  # Minimum messages to create a profile
 MIN_MESSAGES_FOR_ACTIVITY = 5  # Minimum messages to generate activity summary
 HIGH_ENGAGEMENT_THRESHOLD = 5  # Reactions needed for "high engagement" observation
 MAX_OBSERVATIONS_PER_EXTRACTION = 10  # Max observations to add per member per extraction
-STATE_FILENAME = ".extraction_state.yaml"
+CLASSIFY_CACHE_SIZE = 8192  # Distinct message texts memoized by the classifier
+PARALLEL_EXTRACT_MIN_CHANNELS = 8  # Below this, channels are parsed serially
+STATE_FILENAME = ".extraction_state.json"
 
 
 # === Enums ===
@@ -91,19 +111,31 @@ class MessageType(Enum):
     FEATURE_REQUEST = "feature_request"
 
 
+# Order in which categorized messages are combined for keyword extraction
+CATEGORY_ORDER = (
+    MessageType.QUESTION,
+    MessageType.ISSUE_REPORT,
+    MessageType.EXPERTISE,
+    MessageType.INTRODUCTION,
+    MessageType.HIGH_ENGAGEMENT,
+    MessageType.FEEDBACK,
+    MessageType.FEATURE_REQUEST,
+)
+
+
 # === Data Classes ===
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedMessage:
     """A message with its classification."""
 
-    message: ParsedMessage
+    message: "ParsedMessage"
     msg_type: MessageType
     keywords: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemberActivity:
     """Aggregated activity for a single member."""
 
@@ -112,19 +144,17 @@ class MemberActivity:
     server_name: str = ""  # Server name for context
     message_count: int = 0
     channels: Dict[str, int] = field(default_factory=dict)  # channel -> count
-    questions: List[ClassifiedMessage] = field(default_factory=list)
-    issues: List[ClassifiedMessage] = field(default_factory=list)
-    expertise: List[ClassifiedMessage] = field(default_factory=list)
-    introductions: List[ClassifiedMessage] = field(default_factory=list)
-    high_engagement: List[ClassifiedMessage] = field(default_factory=list)
-    feedback: List[ClassifiedMessage] = field(default_factory=list)
-    feature_requests: List[ClassifiedMessage] = field(default_factory=list)
+    # Classified messages per type; a list is only created once a member
+    # has a message of that type, and GENERAL messages are not kept
+    by_type: Dict[MessageType, List[ClassifiedMessage]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
     all_keywords: List[str] = field(default_factory=list)
     first_message: Optional[datetime] = None
     last_message: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelState:
     """Extraction state for a single channel."""
 
@@ -132,7 +162,7 @@ class ChannelState:
     message_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionStateData:
     """Extraction state for a server."""
 
@@ -140,7 +170,7 @@ class ExtractionStateData:
     channels: Dict[str, ChannelState] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of a profile extraction run."""
 
@@ -158,6 +188,10 @@ class ExtractionResult:
 # === Extraction State Management ===
 
 
+# Parsed state files keyed by path; each entry is ((mtime_ns, size), data)
+_STATE_CACHE: Dict[str, tuple] = {}
+
+
 class ExtractionState:
     """Manages extraction state for incremental processing."""
 
@@ -166,7 +200,12 @@ class ExtractionState:
         """Get path to extraction state file."""
         local_dir = os.getenv("CLAUDE_LOCAL_DIR")
         root = Path(local_dir) if local_dir else Path.cwd()
-        return root / "profiles" / platform / f".extraction_state_{server_id}.yaml"
+        return root / "profiles" / platform / f".extraction_state_{server_id}.json"
+
+    @classmethod
+    def _get_legacy_state_path(cls, platform: str, server_id: str) -> Path:
+        """Get path to a state file written in the old YAML format."""
+        return cls._get_state_path(platform, server_id).with_suffix(".yaml")
 
     @classmethod
     def load(cls, platform: str, server_id: str) -> ExtractionStateData:
@@ -179,14 +218,34 @@ class ExtractionState:
         Returns:
             ExtractionStateData object
         """
-        state_path = cls._get_state_path(platform, server_id)
-
-        if not state_path.exists():
+        paths = (
+            cls._get_state_path(platform, server_id),
+            cls._get_legacy_state_path(platform, server_id),
+        )
+        for state_path in paths:
+            try:
+                st = os.stat(state_path)
+            except FileNotFoundError:
+                _STATE_CACHE.pop(str(state_path), None)
+                continue
+            break
+        else:
             return ExtractionStateData()
 
-        with open(state_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-
+        key = str(state_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _STATE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            data = cached[1]
+        elif state_path.suffix == ".json":
+            data = _json_loads(state_path.read_bytes()) or {}
+            _STATE_CACHE[key] = (stamp, data)
+        else:
+            # Legacy YAML state; converted to JSON on the next save
+            data = yaml.load(state_path.read_bytes(), Loader=SafeLoader) or {}
+            _STATE_CACHE[key] = (stamp, data)
+
+        # Built fresh on every call since callers may mutate the result
         channels = {}
         for ch_name, ch_data in data.get("channels", {}).items():
             channels[ch_name] = ChannelState(
@@ -222,16 +281,18 @@ class ExtractionState:
             },
         }
 
-        # Atomic write
-        fd, temp_path = tempfile.mkstemp(dir=state_path.parent, suffix=".yaml")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
-            os.replace(temp_path, state_path)
-        except Exception:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+        # Atomic write: write to temp file then rename
+        _write_atomic(state_path, _json_dumps(data))
+
+        # The JSON state supersedes one left by an older version
+        legacy_path = cls._get_legacy_state_path(platform, server_id)
+        if legacy_path.exists():
+            legacy_path.unlink()
+        _STATE_CACHE.pop(str(legacy_path), None)
+
+        # The next load in this process can reuse what was just written
+        st = os.stat(state_path)
+        _STATE_CACHE[str(state_path)] = ((st.st_mtime_ns, st.st_size), data)
 
     @classmethod
     def reset(cls, platform: str, server_id: str) -> None:
@@ -241,13 +302,62 @@ class ExtractionState:
             platform: Platform identifier
             server_id: Server ID
         """
-        state_path = cls._get_state_path(platform, server_id)
-        if state_path.exists():
-            state_path.unlink()
+        for state_path in (
+            cls._get_state_path(platform, server_id),
+            cls._get_legacy_state_path(platform, server_id),
+        ):
+            _STATE_CACHE.pop(str(state_path), None)
+            if state_path.exists():
+                state_path.unlink()
 
 
 # === Message Classification ===
 
+# Words too common to be useful as keywords
+_STOPWORDS: frozenset[str] = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "need", "to", "of",
+    "in", "for", "on", "with", "at", "by", "from", "as", "into", "through",
+    "during", "before", "after", "and", "but", "or", "so", "yet", "not",
+    "i", "me", "my", "we", "our", "you", "your", "he", "him", "his", "she",
+    "her", "it", "its", "they", "them", "their", "this", "that", "these",
+    "those", "what", "which", "who", "whom", "how", "when", "where", "why",
+    "all", "each", "any", "some", "no", "just", "only", "now", "then",
+    "here", "there", "up", "out", "if", "about", "more", "very", "also",
+    "like", "get", "got", "go", "going", "make", "know", "think", "see",
+    "want", "use", "try", "one", "two", "first", "new", "good", "way",
+    "thing", "something", "anything", "everything", "lol", "yeah", "yes",
+    "ok", "okay", "thanks", "thank", "please", "sorry", "oh", "hi", "hello",
+    "hey", "well", "much", "many", "even", "still", "really", "actually",
+})
+
+_REGEX_METACHARS = frozenset("\\.^$*+?{}[]()|")
+
+
+def _literal_phrases(pattern: str) -> Optional[List[str]]:
+    """Return the phrases of a ``\\b(a|b c)\\b`` pattern, or None for other regexes."""
+    if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+        return None
+    body = pattern[2:-2]
+    if body.startswith("(") and body.endswith(")"):
+        body = body[1:-1]
+    phrases = body.split("|")
+    if not all(phrases) or any(ch in _REGEX_METACHARS for p in phrases for ch in p):
+        return None
+    return phrases
+
+
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """Render a character trie (``""`` marks a phrase end) as a regex."""
+    alternatives = [
+        re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch
+    ]
+    if not alternatives:
+        return ""
+    body = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+    return f"(?:{body})?" if "" in node else body
+
 
 class MessageClassifier:
     """Classifies messages for profile extraction."""
@@ -310,16 +420,83 @@ class MessageClassifier:
         "say-hi",
     }
 
+    # Keyword cleanup: URLs, mentions and emoji codes; keywords are then the
+    # runs of 3+ ASCII letters/digits, with anything else separating words
+    _CLEAN_RE = re.compile(r"https?://\S+|@\w+|:\w+:")
+    _NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+    _WORD_RE = re.compile(r"[a-z0-9]{3,}")
+
     def __init__(self) -> None:
         """Initialize the classifier with compiled patterns."""
-        self._question_re = [re.compile(p, re.IGNORECASE) for p in self.QUESTION_PATTERNS]
-        self._issue_re = [re.compile(p, re.IGNORECASE) for p in self.ISSUE_PATTERNS]
-        self._expertise_re = [re.compile(p, re.IGNORECASE) for p in self.EXPERTISE_PATTERNS]
-        self._intro_re = [re.compile(p, re.IGNORECASE) for p in self.INTRO_PATTERNS]
-        self._feedback_re = [re.compile(p, re.IGNORECASE) for p in self.FEEDBACK_PATTERNS]
-        self._feature_re = [re.compile(p, re.IGNORECASE) for p in self.FEATURE_REQUEST_PATTERNS]
-
-    def classify(self, msg: ParsedMessage) -> MessageType:
+        self._expertise_re = self._compile_any(self.EXPERTISE_PATTERNS)
+        self._intro_re = self._compile_any(self.INTRO_PATTERNS)
+
+        # Content-only checks, in priority order. A category can contribute
+        # more than one pattern (its literal phrases and the rest); any of
+        # them matching classifies the message.
+        self._content_checks = tuple(
+            (pattern, msg_type)
+            for patterns, msg_type in (
+                (self.ISSUE_PATTERNS, MessageType.ISSUE_REPORT),
+                (self.FEATURE_REQUEST_PATTERNS, MessageType.FEATURE_REQUEST),
+                (self.FEEDBACK_PATTERNS, MessageType.FEEDBACK),
+                (self.QUESTION_PATTERNS, MessageType.QUESTION),
+            )
+            for pattern in self._compile_category(patterns)
+        )
+
+        # Chat repeats itself ("thanks!", "+1", bot templates), so content
+        # classification is memoized per classifier instance
+        self._intro_channel_flags: Dict[Optional[str], bool] = {}
+        self._classify_content = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(
+            self._classify_content_uncached
+        )
+
+    def clear_cache(self) -> None:
+        """Drop memoized classification results."""
+        self._intro_channel_flags.clear()
+        self._classify_content.cache_clear()
+
+    @staticmethod
+    def _compile_any(patterns: List[str]) -> "re.Pattern[str]":
+        """Compile a pattern list into one case-insensitive alternation."""
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+    @classmethod
+    def _compile_category(cls, patterns: List[str]) -> List["re.Pattern[str]"]:
+        """Compile a category's patterns, matching its literal phrases via a trie.
+
+        Word-bounded phrase lists such as ``\\b(love|great|awesome)\\b`` are
+        merged into one trie-shaped pattern behind a first-character check,
+        which lets the regex engine skip ahead instead of trying every
+        phrase at every position. Anything else is compiled as usual.
+        """
+        phrases: List[str] = []
+        others: List[str] = []
+        for pattern in patterns:
+            literal = _literal_phrases(pattern)
+            if literal is None:
+                others.append(pattern)
+            else:
+                phrases.extend(literal)
+
+        compiled = []
+        if phrases:
+            first_chars = "".join(sorted({re.escape(p[0]) for p in phrases}))
+            trie: Dict[str, Any] = {}
+            for phrase in phrases:
+                node = trie
+                for ch in phrase:
+                    node = node.setdefault(ch, {})
+                node[""] = {}
+            compiled.append(
+                re.compile(rf"(?=[{first_chars}])\b{_trie_regex(trie)}\b", re.IGNORECASE)
+            )
+        if others:
+            compiled.append(cls._compile_any(others))
+        return compiled
+
+    def classify(self, msg: "ParsedMessage") -> MessageType:
         """Classify a message into a type.
 
         Args:
@@ -328,43 +505,44 @@ class MessageClassifier:
         Returns:
             MessageType classification
         """
-        content = msg.content.lower()
-        channel = msg.channel_name.lower() if msg.channel_name else ""
-
         # Check high engagement first (based on reactions)
         if msg.total_reactions >= HIGH_ENGAGEMENT_THRESHOLD:
             return MessageType.HIGH_ENGAGEMENT
 
+        is_intro_channel = self._intro_channel_flags.get(msg.channel_name)
+        if is_intro_channel is None:
+            channel = msg.channel_name.lower() if msg.channel_name else ""
+            is_intro_channel = any(
+                intro in channel for intro in self.INTRO_CHANNELS
+            )
+            self._intro_channel_flags[msg.channel_name] = is_intro_channel
+
+        return self._classify_content(msg.content, is_intro_channel, msg.is_reply)
+
+    def _classify_content_uncached(
+        self, original: str, is_intro_channel: bool, is_reply: bool
+    ) -> MessageType:
+        """Classify message text once engagement and channel are known."""
+        content = original.lower()
+
         # Check introduction (channel + content)
-        is_intro_channel = any(
-            intro in channel for intro in self.INTRO_CHANNELS
-        )
-        if is_intro_channel and any(p.search(content) for p in self._intro_re):
+        if is_intro_channel and self._intro_re.search(content):
             return MessageType.INTRODUCTION
 
         # Check expertise (replies with code or solutions)
-        if msg.is_reply and any(p.search(msg.content) for p in self._expertise_re):
+        if is_reply and self._expertise_re.search(original):
             return MessageType.EXPERTISE
 
-        # Check issue report
-        if any(p.search(content) for p in self._issue_re):
-            return MessageType.ISSUE_REPORT
-
-        # Check feature request
-        if any(p.search(content) for p in self._feature_re):
-            return MessageType.FEATURE_REQUEST
-
-        # Check feedback
-        if any(p.search(content) for p in self._feedback_re):
-            return MessageType.FEEDBACK
-
-        # Check question
-        if any(p.search(content) for p in self._question_re):
-            return MessageType.QUESTION
+        # Check issue report, then feature request, feedback and question
+        for pattern, msg_type in self._content_checks:
+            if pattern.search(content):
+                return msg_type
 
         return MessageType.GENERAL
 
-    def extract_keywords(self, messages: List[ParsedMessage], top_n: int = 10) -> List[str]:
+    def extract_keywords(
+        self, messages: List["ParsedMessage"], top_n: int = 10
+    ) -> List[str]:
         """Extract top keywords from a list of messages.
 
         Uses simple TF-based extraction without external dependencies.
@@ -376,44 +554,143 @@ class MessageClassifier:
         Returns:
             List of top keywords
         """
-        # Stopwords
-        stopwords = {
-            "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "shall", "can", "need", "to", "of",
-            "in", "for", "on", "with", "at", "by", "from", "as", "into", "through",
-            "during", "before", "after", "and", "but", "or", "so", "yet", "not",
-            "i", "me", "my", "we", "our", "you", "your", "he", "him", "his", "she",
-            "her", "it", "its", "they", "them", "their", "this", "that", "these",
-            "those", "what", "which", "who", "whom", "how", "when", "where", "why",
-            "all", "each", "any", "some", "no", "just", "only", "now", "then",
-            "here", "there", "up", "out", "if", "about", "more", "very", "also",
-            "like", "get", "got", "go", "going", "make", "know", "think", "see",
-            "want", "use", "try", "one", "two", "first", "new", "good", "way",
-            "thing", "something", "anything", "everything", "lol", "yeah", "yes",
-            "ok", "okay", "thanks", "thank", "please", "sorry", "oh", "hi", "hello",
-            "hey", "well", "much", "many", "even", "still", "really", "actually",
-        }
-
-        # Count word frequencies
-        word_counts: Dict[str, int] = defaultdict(int)
+        # Count word frequencies; Counter.update tallies each message's
+        # words in C, and stopwords are dropped once at the end (deleting
+        # keys leaves the first-seen order of the rest intact)
+        word_counts: "Counter[str]" = Counter()
 
         for msg in messages:
-            # Clean and tokenize
-            text = re.sub(r"https?://\S+", "", msg.content)  # Remove URLs
-            text = re.sub(r"@\w+", "", text)  # Remove mentions
-            text = re.sub(r":\w+:", "", text)  # Remove emoji codes
-            text = re.sub(r"[^a-zA-Z0-9\s]", " ", text)  # Keep alphanumeric
-
-            words = text.lower().split()
-
-            for word in words:
-                if word and len(word) >= 3 and word not in stopwords:
-                    word_counts[word] += 1
+            # Clean and tokenize: drop URLs, mentions and emoji codes in one
+            # pass, then pick out the words of 3+ characters
+            text = self._CLEAN_RE.sub("", msg.content)
+            if not text.isascii():
+                # Non-ASCII characters only separate words; blank them before
+                # lower() can map one to ASCII (e.g. the Kelvin sign to "k")
+                text = self._NON_ASCII_RE.sub(" ", text)
+
+            word_counts.update(self._WORD_RE.findall(text.lower()))
+
+        for word in _STOPWORDS.intersection(word_counts):
+            del word_counts[word]
+
+        # Top N by frequency; ties keep first-seen order, as a stable sort would
+        return [word for word, _ in word_counts.most_common(top_n)]
+
+
+# === Channel Scanning ===
+
+
+def _scan_channel(
+    parser: "MessageParser",
+    classify: Callable[["ParsedMessage"], MessageType],
+    file_path: Path,
+    since: Optional[str],
+    server_name: str,
+    member_activity: Dict[str, MemberActivity],
+) -> Tuple[str, int, int]:
+    """Aggregate one channel's messages into member_activity.
+
+    Args:
+        parser: Parser for the channel's messages.md
+        classify: Message classifier
+        file_path: Path to the channel's messages.md
+        since: Skip messages dated on or before this (incremental mode)
+        server_name: Server name recorded on new activities
+        member_activity: Activity per member, updated in place
+
+    Returns:
+        (latest date seen, message count, messages processed)
+    """
+    channel_name = file_path.parent.name
+    latest_date = ""
+    msg_count = 0
+    general = MessageType.GENERAL
+
+    # The parser leaves out (without decoding) messages dated on or before
+    # since, only reporting how many it skipped per date
+    skipped: Dict[str, int] = {}
+
+    for msg in parser.parse_file(file_path, channel_name, since=since, skipped=skipped):
+        # Channel state (last date seen) covers every message
+        msg_count += 1
+        date_str = msg.date_str
+        if date_str > latest_date:
+            latest_date = date_str
+
+        # Get or create member activity, updating its timestamps
+        member_id = msg.author_id
+        timestamp = msg.timestamp
+        activity = member_activity.get(member_id)
+        if activity is None:
+            activity = member_activity[member_id] = MemberActivity(
+                member_id=member_id,
+                display_name=msg.author_name,
+                server_name=server_name,
+                first_message=timestamp,
+                last_message=timestamp,
+            )
+        elif timestamp < activity.first_message:
+            activity.first_message = timestamp
+        elif timestamp > activity.last_message:
+            activity.last_message = timestamp
+
+        # Update basic stats
+        activity.message_count += 1
+        channels = activity.channels
+        channels[channel_name] = channels.get(channel_name, 0) + 1
+
+        # Classify and categorize
+        msg_type = classify(msg)
+        if msg_type is not general:
+            activity.by_type[msg_type].append(
+                ClassifiedMessage(message=msg, msg_type=msg_type)
+            )
 
-        # Sort by frequency and return top N
-        sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:top_n]]
+    # Skipped messages still count toward the channel state
+    processed = msg_count
+    for date_str, count in skipped.items():
+        msg_count += count
+        if date_str > latest_date:
+            latest_date = date_str
+
+    return latest_date, msg_count, processed
+
+
+def _scan_channel_file(
+    file_path: Path, since: Optional[str], server_name: str
+) -> Tuple[Dict[str, MemberActivity], str, int, int]:
+    """Scan one messages.md into fresh activity; runs in a worker process."""
+    member_activity: Dict[str, MemberActivity] = {}
+    scan = _scan_channel(
+        _get_message_parser_class()(),
+        MessageClassifier().classify,
+        file_path,
+        since,
+        server_name,
+        member_activity,
+    )
+    return (member_activity, *scan)
+
+
+def _merge_activity(
+    member_activity: Dict[str, MemberActivity], partial: Dict[str, MemberActivity]
+) -> None:
+    """Merge one channel's activity into the server-wide activity."""
+    for member_id, activity in partial.items():
+        merged = member_activity.get(member_id)
+        if merged is None:
+            member_activity[member_id] = activity
+            continue
+
+        merged.message_count += activity.message_count
+        for channel_name, count in activity.channels.items():
+            merged.channels[channel_name] = merged.channels.get(channel_name, 0) + count
+        if activity.first_message < merged.first_message:
+            merged.first_message = activity.first_message
+        if activity.last_message > merged.last_message:
+            merged.last_message = activity.last_message
+        for msg_type, classified in activity.by_type.items():
+            merged.by_type[msg_type].extend(classified)
 
 
 # === Profile Extractor ===
@@ -430,7 +707,14 @@ class ProfileExtractor:
         """
         self.store = store or ProfileStore()
         self.classifier = MessageClassifier()
-        self.parser = MessageParser()
+        self._parser: Optional["MessageParser"] = None
+
+    @property
+    def parser(self) -> "MessageParser":
+        """MessageParser, imported and created on first use."""
+        if self._parser is None:
+            self._parser = _get_message_parser_class()()
+        return self._parser
 
     def _get_server_dir(self, platform: str, server_id: str) -> Optional[Path]:
         """Find the server data directory.
@@ -464,6 +748,7 @@ class ProfileExtractor:
         dry_run: bool = False,
         min_messages: int = MIN_MESSAGES_FOR_PROFILE,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        parallel: bool = True,
     ) -> ExtractionResult:
         """Extract profiles from a server's synced messages.
 
@@ -474,6 +759,9 @@ class ProfileExtractor:
             dry_run: If True, don't actually save profiles
             min_messages: Minimum messages required to create a profile
             progress_callback: Optional callback(stage, current, total)
+            parallel: If True, parse channels in worker processes when the
+                server has at least PARALLEL_EXTRACT_MIN_CHANNELS of them and
+                more than one CPU is available
 
         Returns:
             ExtractionResult with statistics
@@ -513,151 +801,142 @@ class ProfileExtractor:
             channels={},
         )
 
+        # Last processed date per channel file, for incremental runs
+        since_dates: List[Optional[str]] = []
+        for file_path in message_files:
+            channel_state = state.channels.get(file_path.parent.name)
+            since_dates.append(
+                channel_state.last_processed_date if incremental and channel_state else None
+            )
+
+        # Channels are independent, so large servers parse them in worker
+        # processes and merge the per-channel activity here, in file order
+        scans = None
+        # A pool only pays off with more than one CPU to spread work over
+        if (parallel and total_files >= PARALLEL_EXTRACT_MIN_CHANNELS
+                and (os.cpu_count() or 1) > 1):
+            # Results carry ParsedMessage objects, so the parser module must
+            # be importable here before they're unpickled
+            _get_message_parser_class()
+            try:
+                with ProcessPoolExecutor() as executor:
+                    scans = list(executor.map(
+                        _scan_channel_file,
+                        message_files,
+                        since_dates,
+                        [server_name] * total_files,
+                    ))
+            except (OSError, BrokenProcessPool):
+                scans = None  # No worker processes here; parse serially
+
         # Process each channel
         for idx, file_path in enumerate(message_files):
             channel_name = file_path.parent.name
-            channel_state = state.channels.get(channel_name)
 
             if progress_callback:
                 progress_callback("parsing", idx + 1, total_files)
 
-            # Parse messages from this channel
-            for msg in self.parser.parse_file(file_path, channel_name):
-                # Check if we should skip (incremental mode)
-                if incremental and channel_state:
-                    if msg.date_str <= channel_state.last_processed_date:
-                        continue
-
-                result.messages_processed += 1
-
-                # Get or create member activity
-                member_id = msg.author_id
-                if member_id not in member_activity:
-                    member_activity[member_id] = MemberActivity(
-                        member_id=member_id,
-                        display_name=msg.author_name,
-                        server_name=server_name,
-                    )
-
-                activity = member_activity[member_id]
-
-                # Update basic stats
-                activity.message_count += 1
-                activity.channels[channel_name] = activity.channels.get(channel_name, 0) + 1
-
-                # Update timestamps
-                if activity.first_message is None or msg.timestamp < activity.first_message:
-                    activity.first_message = msg.timestamp
-                if activity.last_message is None or msg.timestamp > activity.last_message:
-                    activity.last_message = msg.timestamp
-
-                # Classify and categorize
-                msg_type = self.classifier.classify(msg)
-                classified = ClassifiedMessage(message=msg, msg_type=msg_type)
-
-                if msg_type == MessageType.QUESTION:
-                    activity.questions.append(classified)
-                elif msg_type == MessageType.ISSUE_REPORT:
-                    activity.issues.append(classified)
-                elif msg_type == MessageType.EXPERTISE:
-                    activity.expertise.append(classified)
-                elif msg_type == MessageType.INTRODUCTION:
-                    activity.introductions.append(classified)
-                elif msg_type == MessageType.HIGH_ENGAGEMENT:
-                    activity.high_engagement.append(classified)
-                elif msg_type == MessageType.FEEDBACK:
-                    activity.feedback.append(classified)
-                elif msg_type == MessageType.FEATURE_REQUEST:
-                    activity.feature_requests.append(classified)
-
-            # Update channel state (track last date seen)
-            latest_date = ""
-            msg_count = 0
-            for msg in self.parser.parse_file(file_path, channel_name):
-                msg_count += 1
-                if msg.date_str > latest_date:
-                    latest_date = msg.date_str
+            if scans is not None:
+                partial, latest_date, msg_count, processed = scans[idx]
+                _merge_activity(member_activity, partial)
+            else:
+                latest_date, msg_count, processed = _scan_channel(
+                    self.parser,
+                    self.classifier.classify,
+                    file_path,
+                    since_dates[idx],
+                    server_name,
+                    member_activity,
+                )
+            result.messages_processed += processed
 
+            # Update channel state
             new_state.channels[channel_name] = ChannelState(
                 last_processed_date=latest_date or datetime.now().strftime("%Y-%m-%d"),
                 message_count=msg_count,
             )
 
+        # Memoized classifications are per server; don't hold them past parsing
+        self.classifier.clear_cache()
+
         result.members_found = len(member_activity)
 
         if progress_callback:
             progress_callback("generating", 0, len(member_activity))
 
-        # Generate profiles for each member
-        for idx, (member_id, activity) in enumerate(member_activity.items()):
-            if progress_callback:
-                progress_callback("generating", idx + 1, len(member_activity))
-
-            # Skip if not enough messages
-            if activity.message_count < min_messages:
-                result.skipped_insufficient_messages += 1
-                continue
-
-            # Extract keywords for this member
-            all_messages = []
-            for cm in (
-                activity.questions
-                + activity.issues
-                + activity.expertise
-                + activity.introductions
-                + activity.high_engagement
-                + activity.feedback
-                + activity.feature_requests
-            ):
-                all_messages.append(cm.message)
-
-            activity.all_keywords = self.classifier.extract_keywords(all_messages)
-
-            # Generate observations
-            observations = self._generate_observations(activity)
-
-            if not observations:
-                continue
-
-            # Save or update profile
-            if not dry_run:
-                try:
-                    existing = self.store.get(platform, member_id)
-                    if existing:
-                        # Add new observations (limited to avoid spam)
-                        for obs_text in observations[:MAX_OBSERVATIONS_PER_EXTRACTION]:
-                            self.store.add_observation(
+        # Per-member lookups hoisted out of the loop below
+        max_observations = MAX_OBSERVATIONS_PER_EXTRACTION
+        extract_keywords = self.classifier.extract_keywords
+        store_get = self.store.get
+        add_observation = self.store.add_observation
+
+        # Generate profiles for each member; the profile index is written
+        # once at the end instead of after every profile save
+        with self.store.batch():
+            for idx, (member_id, activity) in enumerate(member_activity.items()):
+                if progress_callback:
+                    progress_callback("generating", idx + 1, len(member_activity))
+
+                # Skip if not enough messages
+                if activity.message_count < min_messages:
+                    result.skipped_insufficient_messages += 1
+                    continue
+
+                # Extract keywords for this member
+                by_type = activity.by_type
+                all_messages = [
+                    cm.message
+                    for msg_type in CATEGORY_ORDER
+                    for cm in by_type.get(msg_type, ())
+                ]
+
+                activity.all_keywords = extract_keywords(all_messages)
+
+                # Generate observations
+                observations = self._generate_observations(activity)
+
+                if not observations:
+                    continue
+
+                # Save or update profile
+                if not dry_run:
+                    try:
+                        existing = store_get(platform, member_id)
+                        if existing:
+                            # Add new observations (limited to avoid spam)
+                            for obs_text in observations[:max_observations]:
+                                add_observation(
+                                    platform=platform,
+                                    member_id=member_id,
+                                    text=obs_text,
+                                )
+                            result.profiles_updated += 1
+                        else:
+                            # Create new profile with first observation
+                            profile = create_profile(
                                 platform=platform,
                                 member_id=member_id,
-                                text=obs_text,
+                                display_name=activity.display_name,
+                                initial_observation=observations[0],
                             )
+                            # Add remaining observations
+                            self.store.save(profile)
+                            for obs_text in observations[1:max_observations]:
+                                add_observation(
+                                    platform=platform,
+                                    member_id=member_id,
+                                    text=obs_text,
+                                )
+                            result.profiles_created += 1
+                    except Exception as e:
+                        result.errors.append(f"Failed to save profile {member_id}: {e}")
+                else:
+                    # Dry run - just count
+                    existing = store_get(platform, member_id)
+                    if existing:
                         result.profiles_updated += 1
                     else:
-                        # Create new profile with first observation
-                        profile = create_profile(
-                            platform=platform,
-                            member_id=member_id,
-                            display_name=activity.display_name,
-                            initial_observation=observations[0],
-                        )
-                        # Add remaining observations
-                        self.store.save(profile)
-                        for obs_text in observations[1:MAX_OBSERVATIONS_PER_EXTRACTION]:
-                            self.store.add_observation(
-                                platform=platform,
-                                member_id=member_id,
-                                text=obs_text,
-                            )
                         result.profiles_created += 1
-                except Exception as e:
-                    result.errors.append(f"Failed to save profile {member_id}: {e}")
-            else:
-                # Dry run - just count
-                existing = self.store.get(platform, member_id)
-                if existing:
-                    result.profiles_updated += 1
-                else:
-                    result.profiles_created += 1
 
         # Save extraction state
         if not dry_run:
@@ -675,12 +954,18 @@ class ProfileExtractor:
             List of observation strings
         """
         observations: List[str] = []
+        by_type = activity.by_type
+        introductions = by_type.get(MessageType.INTRODUCTION, ())
+        questions = by_type.get(MessageType.QUESTION, ())
+        issues = by_type.get(MessageType.ISSUE_REPORT, ())
+        expertise = by_type.get(MessageType.EXPERTISE, ())
+        high_engagement = by_type.get(MessageType.HIGH_ENGAGEMENT, ())
+        feature_requests = by_type.get(MessageType.FEATURE_REQUEST, ())
+        feedback = by_type.get(MessageType.FEEDBACK, ())
 
         # 1. Activity summary (if enough messages)
         if activity.message_count >= MIN_MESSAGES_FOR_ACTIVITY:
-            top_channels = sorted(
-                activity.channels.items(), key=lambda x: x[1], reverse=True
-            )[:3]
+            top_channels = heapq.nlargest(3, activity.channels.items(), key=lambda x: x[1])
             channel_str = ", ".join(f"#{ch}" for ch, _ in top_channels)
 
             keywords_str = ""
@@ -693,77 +978,77 @@ class ProfileExtractor:
             )
 
         # 2. Introduction (if present)
-        if activity.introductions:
-            intro = activity.introductions[0].message
+        if introductions:
+            intro = introductions[0].message
             # Extract self-description
             content = intro.content[:200].replace("\n", " ").strip()
             if content:
                 observations.append(f"Self-intro: {content}")
 
         # 3. Questions asked (summarize if multiple)
-        if activity.questions:
-            if len(activity.questions) == 1:
-                q = activity.questions[0].message.content[:150].replace("\n", " ")
+        if questions:
+            if len(questions) == 1:
+                q = questions[0].message.content[:150].replace("\n", " ")
                 observations.append(f"Asked: {q}")
             else:
                 # Summarize topics
                 keywords = self.classifier.extract_keywords(
-                    [cm.message for cm in activity.questions], top_n=5
+                    [cm.message for cm in questions], top_n=5
                 )
                 if keywords:
                     observations.append(
-                        f"Asked {len(activity.questions)} questions about: {', '.join(keywords)}"
+                        f"Asked {len(questions)} questions about: {', '.join(keywords)}"
                     )
 
         # 4. Issues reported
-        if activity.issues:
-            if len(activity.issues) == 1:
-                issue = activity.issues[0].message.content[:150].replace("\n", " ")
+        if issues:
+            if len(issues) == 1:
+                issue = issues[0].message.content[:150].replace("\n", " ")
                 observations.append(f"Reported issue: {issue}")
             else:
                 keywords = self.classifier.extract_keywords(
-                    [cm.message for cm in activity.issues], top_n=5
+                    [cm.message for cm in issues], top_n=5
                 )
                 if keywords:
                     observations.append(
-                        f"Reported {len(activity.issues)} issues related to: {', '.join(keywords)}"
+                        f"Reported {len(issues)} issues related to: {', '.join(keywords)}"
                     )
 
         # 5. Expertise demonstrated
-        if activity.expertise:
-            if len(activity.expertise) == 1:
-                exp = activity.expertise[0].message.content[:150].replace("\n", " ")
+        if expertise:
+            if len(expertise) == 1:
+                exp = expertise[0].message.content[:150].replace("\n", " ")
                 observations.append(f"Helped with: {exp}")
             else:
                 keywords = self.classifier.extract_keywords(
-                    [cm.message for cm in activity.expertise], top_n=5
+                    [cm.message for cm in expertise], top_n=5
                 )
                 if keywords:
                     observations.append(
-                        f"Helped others {len(activity.expertise)} times; expertise: {', '.join(keywords)}"
+                        f"Helped others {len(expertise)} times; expertise: {', '.join(keywords)}"
                     )
 
         # 6. High engagement posts
-        if activity.high_engagement:
-            top = max(activity.high_engagement, key=lambda cm: cm.message.total_reactions)
+        if high_engagement:
+            top = max(high_engagement, key=lambda cm: cm.message.total_reactions)
             content = top.message.content[:100].replace("\n", " ")
             observations.append(
                 f"Popular post ({top.message.total_reactions} reactions): {content}"
             )
 
         # 7. Feature requests
-        if activity.feature_requests:
-            if len(activity.feature_requests) >= 2:
+        if feature_requests:
+            if len(feature_requests) >= 2:
                 observations.append(
-                    f"Submitted {len(activity.feature_requests)} feature requests"
+                    f"Submitted {len(feature_requests)} feature requests"
                 )
             else:
-                fr = activity.feature_requests[0].message.content[:150].replace("\n", " ")
+                fr = feature_requests[0].message.content[:150].replace("\n", " ")
                 observations.append(f"Suggested: {fr}")
 
         # 8. Feedback given
-        if activity.feedback and len(activity.feedback) >= 3:
-            observations.append(f"Actively provides feedback ({len(activity.feedback)} messages)")
+        if feedback and len(feedback) >= 3:
+            observations.append(f"Actively provides feedback ({len(feedback)} messages)")
 
         return observations
 
@@ -8,6 +8,11 @@ from pathlib import Path
 from typing import List
 
 
+# Characters invalid in file paths across platforms, mapped to "_"
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]+')
+
+
 class StorageError(Exception):
     """Storage operation failed."""
     pass
@@ -33,10 +38,7 @@ def sanitize_name(name: str) -> str:
     Returns:
         Sanitized lowercase name
     """
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, "_")
-    return name.lower().strip()
+    return name.translate(_SANITIZE_TABLE).lower().strip()
 
 
 def slugify(name: str, max_length: int = 50) -> str:
@@ -50,9 +52,9 @@ def slugify(name: str, max_length: int = 50) -> str:
         URL-friendly slug
     """
     # Remove special characters, keep alphanumeric and spaces
-    slug = re.sub(r'[^\w\s-]', '', name.lower())
-    # Replace spaces with hyphens
-    slug = re.sub(r'[\s_]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', name.lower())
+    # Collapse whitespace/underscore runs into hyphens (str.split matches \s)
+    slug = '-'.join(slug.replace('_', ' ').split())
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
     return slug[:max_length]
@@ -0,0 +1 @@
+"""Community Agent tests."""
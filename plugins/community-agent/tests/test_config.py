@@ -0,0 +1,94 @@
+"""Tests for config module."""
+
+import os
+import pytest
+import tempfile
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+from lib.config import _load_env_file, _parse_env_file, _read_config_file
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for config files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def _load_twice(path):
+    """Load a config file twice, the second time through any sidecar."""
+    first = _read_config_file(path, path.stat())
+    second = _read_config_file(path, path.stat())
+    return first, second
+
+
+class TestConfigSidecar:
+    """Tests for the agents.yaml JSON sidecar."""
+
+    def test_reload_matches_first_load(self, temp_dir):
+        """Test that the sidecar returns the same data as the YAML."""
+        path = temp_dir / "agents.yaml"
+        path.write_text("discord:\n  server_id: '123'\n  channels: [a, b]\n")
+
+        first, second = _load_twice(path)
+
+        assert (temp_dir / "agents.yaml.json").exists()
+        assert second == first
+
+    def test_non_string_keys_keep_their_type(self, temp_dir):
+        """Test that unquoted numeric keys survive a second load."""
+        path = temp_dir / "agents.yaml"
+        path.write_text("servers:\n  1092630146143506494:\n    name: Test\n")
+
+        first, second = _load_twice(path)
+
+        assert second == first
+        assert list(second["servers"]) == [1092630146143506494]
+        assert not (temp_dir / "agents.yaml.json").exists()
+
+    def test_edit_with_same_mtime_is_reloaded(self, temp_dir):
+        """Test that a stale sidecar is ignored when the YAML size changes."""
+        path = temp_dir / "agents.yaml"
+        path.write_text("a: 1\n")
+        st = path.stat()
+        _read_config_file(path, st)
+
+        path.write_text("a: 22\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert _read_config_file(path, path.stat()) == {"a": 22}
+
+
+class TestEnvFile:
+    """Tests for .env loading."""
+
+    @pytest.mark.parametrize("content", [
+        'A="bar" # comment\n',
+        "A='bar' # comment\n",
+        'A="line1\\nline2"\n',
+        'A=plain # comment\nexport B=two\n',
+        'BASE=/srv\nA="${BASE}/data"\n',
+        "# only a comment\n\nA=\n",
+    ])
+    def test_matches_dotenv_values(self, temp_dir, content):
+        """Test that parsing agrees with python-dotenv."""
+        path = temp_dir / ".env"
+        path.write_text(content)
+
+        assert _parse_env_file(path) == dotenv_values(path)
+
+    def test_existing_environment_wins(self, temp_dir, monkeypatch):
+        """Test that variables already set are not overridden."""
+        path = temp_dir / ".env"
+        path.write_text("CA_TEST_SET=file\nCA_TEST_UNSET=file\n")
+        monkeypatch.setenv("CA_TEST_SET", "env")
+        # setenv first so monkeypatch removes the loaded value afterwards
+        monkeypatch.setenv("CA_TEST_UNSET", "")
+        monkeypatch.delenv("CA_TEST_UNSET")
+
+        _load_env_file(path)
+
+        assert os.environ["CA_TEST_SET"] == "env"
+        assert os.environ["CA_TEST_UNSET"] == "file"
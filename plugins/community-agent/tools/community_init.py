@@ -78,7 +78,7 @@ def run_quickstart(config) -> int:
     config.set_persona(persona.to_dict())
 
     print(f"Bot Persona: {persona.name} ({persona.role})")
-    print(f"  Personality: {persona.personality.split('.')[0]}.")
+    print(f"  Personality: {persona.personality.partition('.')[0]}.")
     print(f"  Tasks: {', '.join(persona.tasks[:3])}")
     print()
     print("Tip: Run with --mode advanced to customize persona")
@@ -125,7 +125,7 @@ def run_advanced(config, args) -> int:
 
     print()
     print(f"Bot Persona: {persona.name} ({persona.role})")
-    print(f"  Personality: {persona.personality.split('.')[0]}.")
+    print(f"  Personality: {persona.personality.partition('.')[0]}.")
     print(f"  Style: {persona.communication_style}")
     if persona.tasks:
         print(f"  Tasks: {', '.join(persona.tasks[:3])}")
@@ -218,7 +218,7 @@ if __name__ == "__main__":
             print(f"\n{preset_id}:")
             print(f"  Name: {persona.name}")
             print(f"  Role: {persona.role}")
-            print(f"  Personality: {persona.personality.split('.')[0]}.")
+            print(f"  Personality: {persona.personality.partition('.')[0]}.")
         sys.exit(0)
 
     exit_code = main(args)
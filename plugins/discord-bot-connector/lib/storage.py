@@ -29,6 +29,9 @@ class SyncMode(Enum):
 # Default message limit for DMs (privacy-conscious)
 DM_DEFAULT_LIMIT = 100
 
+# Characters not allowed in directory/file names, mapped to "_"
+_INVALID_CHARS_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 
 @dataclass
 class SyncProgress:
@@ -238,10 +241,7 @@ class Storage:
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for use as directory/filename."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        return name.lower().strip()
+        return name.translate(_INVALID_CHARS_TABLE).lower().strip()
 
     def _slugify(self, name: str) -> str:
         """Convert a name to a URL-friendly slug."""
@@ -1,62 +1,102 @@
 """Discord User Sync library modules."""
 
-from .config import Config, ConfigError, get_config, reload_config
-from .discord_client import (
-    AuthenticationError,
-    DiscordClientError,
-    DiscordUserClient
-)
-from .markdown_formatter import (
-    format_attachment,
-    format_channel_header,
-    format_date_header,
-    format_embed,
-    format_message,
-    format_messages_markdown,
-    format_reactions,
-    format_reply_indicator,
-    group_messages_by_date
-)
-from .rate_limiter import RateLimiter
-from .storage import Storage, StorageError, get_storage
-from .global_rate_limiter import GlobalRateLimiter
-from .batched_writer import BatchedWriter
-from .multi_server_sync import MultiServerSyncOrchestrator, MultiServerSyncSummary
+import importlib
+
+# Imported eagerly: the slugify submodule shares its name with the function,
+# so once the submodule is loaded the package attribute would shadow any
+# lazy lookup
 from .slugify import slugify, make_hybrid_name, parse_hybrid_name, extract_id_from_hybrid
-from .member_models import (
-    EngagementTier,
-    MemberBasic,
-    ConnectedAccount,
-    MemberRichProfile,
-    MemberActivity,
-    MemberSnapshot,
-    CurrentMemberList,
-    ChurnedMember,
-    SyncOperation,
-    ServerMetadata,
-)
-from .profile_models import (
-    Observation,
-    ServerMembership,
-    DiscordData,
-    BehavioralData,
-    InferredInterest,
-    DerivedInsights,
-    UnifiedMemberProfile,
-    ProfileIndex,
-)
-from .member_storage import MemberStorage, MemberStorageError, get_member_storage
-from .profile_index import ProfileManager, ProfileIndexError, get_profile_manager
-from .gateway_client import GatewayMemberFetcher, RichProfileFetcher, GatewayClientError
-from .fuzzy_search import (
-    MatchField,
-    MatchReason,
-    SearchResult,
-    SearchQuery,
-    FuzzySearchEngine,
-    search_members,
-    search_basic_members,
-)
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing one piece of the package doesn't
+# pay for every dependency of the others.
+_LAZY_ATTRS = {
+    # config
+    "Config": "config",
+    "ConfigError": "config",
+    "get_config": "config",
+    "reload_config": "config",
+    # discord_client
+    "AuthenticationError": "discord_client",
+    "DiscordClientError": "discord_client",
+    "DiscordUserClient": "discord_client",
+    # markdown_formatter
+    "format_attachment": "markdown_formatter",
+    "format_channel_header": "markdown_formatter",
+    "format_date_header": "markdown_formatter",
+    "format_embed": "markdown_formatter",
+    "format_message": "markdown_formatter",
+    "format_messages_markdown": "markdown_formatter",
+    "format_reactions": "markdown_formatter",
+    "format_reply_indicator": "markdown_formatter",
+    "group_messages_by_date": "markdown_formatter",
+    # rate_limiter
+    "RateLimiter": "rate_limiter",
+    # storage
+    "Storage": "storage",
+    "StorageError": "storage",
+    "get_storage": "storage",
+    # global_rate_limiter
+    "GlobalRateLimiter": "global_rate_limiter",
+    # batched_writer
+    "BatchedWriter": "batched_writer",
+    # multi_server_sync
+    "MultiServerSyncOrchestrator": "multi_server_sync",
+    "MultiServerSyncSummary": "multi_server_sync",
+    # member_models
+    "EngagementTier": "member_models",
+    "MemberBasic": "member_models",
+    "ConnectedAccount": "member_models",
+    "MemberRichProfile": "member_models",
+    "MemberActivity": "member_models",
+    "MemberSnapshot": "member_models",
+    "CurrentMemberList": "member_models",
+    "ChurnedMember": "member_models",
+    "SyncOperation": "member_models",
+    "ServerMetadata": "member_models",
+    # profile_models
+    "Observation": "profile_models",
+    "ServerMembership": "profile_models",
+    "DiscordData": "profile_models",
+    "BehavioralData": "profile_models",
+    "InferredInterest": "profile_models",
+    "DerivedInsights": "profile_models",
+    "UnifiedMemberProfile": "profile_models",
+    "ProfileIndex": "profile_models",
+    # member_storage
+    "MemberStorage": "member_storage",
+    "MemberStorageError": "member_storage",
+    "get_member_storage": "member_storage",
+    # profile_index
+    "ProfileManager": "profile_index",
+    "ProfileIndexError": "profile_index",
+    "get_profile_manager": "profile_index",
+    # gateway_client
+    "GatewayMemberFetcher": "gateway_client",
+    "RichProfileFetcher": "gateway_client",
+    "GatewayClientError": "gateway_client",
+    # fuzzy_search
+    "MatchField": "fuzzy_search",
+    "MatchReason": "fuzzy_search",
+    "SearchResult": "fuzzy_search",
+    "SearchQuery": "fuzzy_search",
+    "FuzzySearchEngine": "fuzzy_search",
+    "search_members": "fuzzy_search",
+    "search_basic_members": "fuzzy_search",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Config
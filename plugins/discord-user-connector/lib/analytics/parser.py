@@ -4,11 +4,12 @@ Parses the markdown message format used by the storage module to extract
 structured message data for analytics.
 """
 
+import mmap
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
 
 
 # Regex patterns for parsing message format
@@ -38,6 +39,12 @@ EMBED_PATTERN = re.compile(r'^> \[embed\]')
 # YAML frontmatter
 FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
 
+# Byte-level patterns for scanning a mapped file without decoding it:
+# date headers, and candidate message header lines (confirmed by decoding
+# just that line and matching MESSAGE_HEADER_PATTERN)
+DATE_HEADER_BYTES_PATTERN = re.compile(rb'^## (\d{4}-\d{2}-\d{2})$', re.MULTILINE)
+MESSAGE_HEADER_BYTES_PATTERN = re.compile(rb'^### [^\n]*', re.MULTILINE)
+
 
 @dataclass
 class ParsedMessage:
@@ -94,7 +101,9 @@ class MessageParser:
     def parse_file(
         self,
         file_path: Path,
-        channel_name: str = ""
+        channel_name: str = "",
+        since: Optional[str] = None,
+        skipped: Optional[Dict[str, int]] = None,
     ) -> Generator[ParsedMessage, None, None]:
         """Parse messages from a markdown file.
 
@@ -103,6 +112,11 @@ class MessageParser:
         Args:
             file_path: Path to messages.md file.
             channel_name: Optional channel name override.
+            since: If given, only yield messages dated after this date
+                (YYYY-MM-DD). Earlier date sections are skipped at the
+                byte level without being decoded.
+            skipped: Optional dict filled with date -> number of messages
+                left out because of since.
 
         Yields:
             ParsedMessage objects.
@@ -110,61 +124,147 @@ class MessageParser:
         if not file_path.exists():
             return
 
+        if since is not None:
+            yield from self._parse_file_since(file_path, channel_name, since, skipped)
+            return
+
         # Read file in chunks for large files
         with open(file_path, 'r', encoding='utf-8') as f:
-            current_date = ""
-            current_message: Optional[Dict] = None
-            content_lines: List[str] = []
+            yield from self._parse_lines(f, channel_name)
 
-            for line in f:
-                line = line.rstrip('\n')
-
-                # Check for date header
-                date_match = DATE_HEADER_PATTERN.match(line)
-                if date_match:
-                    # Yield pending message
-                    if current_message:
-                        yield self._finalize_message(
-                            current_message, content_lines, current_date, channel_name
-                        )
-                        current_message = None
-                        content_lines = []
-
-                    current_date = date_match.group(1)
-                    continue
-
-                # Check for message header
-                header_match = MESSAGE_HEADER_PATTERN.match(line)
-                if header_match:
-                    # Yield pending message
-                    if current_message:
-                        yield self._finalize_message(
-                            current_message, content_lines, current_date, channel_name
-                        )
-                        content_lines = []
-
-                    time_str, author_name, author_id = header_match.groups()
-                    current_message = {
-                        'time_str': time_str,
-                        'author_name': author_name,
-                        'author_id': author_id,
-                        'is_reply': False,
-                        'reply_to_author': None,
-                        'reactions': {},
-                        'has_attachment': False,
-                        'has_embed': False,
-                    }
-                    continue
-
-                # Collect content lines
-                if current_message is not None:
-                    content_lines.append(line)
-
-            # Yield last message
-            if current_message:
-                yield self._finalize_message(
-                    current_message, content_lines, current_date, channel_name
-                )
+    def _parse_lines(
+        self,
+        lines: Iterable[str],
+        channel_name: str,
+        current_date: str = ""
+    ) -> Generator[ParsedMessage, None, None]:
+        """Parse messages from lines of a messages file.
+
+        Args:
+            lines: Lines of the file, with or without trailing newlines.
+            channel_name: Channel name.
+            current_date: Date of the section the lines start in.
+
+        Yields:
+            ParsedMessage objects.
+        """
+        current_message: Optional[Dict] = None
+        content_lines: List[str] = []
+
+        for line in lines:
+            line = line.rstrip('\n')
+
+            # Check for date header
+            date_match = DATE_HEADER_PATTERN.match(line)
+            if date_match:
+                # Yield pending message
+                if current_message:
+                    yield self._finalize_message(
+                        current_message, content_lines, current_date, channel_name
+                    )
+                    current_message = None
+                    content_lines = []
+
+                current_date = date_match.group(1)
+                continue
+
+            # Check for message header
+            header_match = MESSAGE_HEADER_PATTERN.match(line)
+            if header_match:
+                # Yield pending message
+                if current_message:
+                    yield self._finalize_message(
+                        current_message, content_lines, current_date, channel_name
+                    )
+                    content_lines = []
+
+                time_str, author_name, author_id = header_match.groups()
+                current_message = {
+                    'time_str': time_str,
+                    'author_name': author_name,
+                    'author_id': author_id,
+                    'is_reply': False,
+                    'reply_to_author': None,
+                    'reactions': {},
+                    'has_attachment': False,
+                    'has_embed': False,
+                }
+                continue
+
+            # Collect content lines
+            if current_message is not None:
+                content_lines.append(line)
+
+        # Yield last message
+        if current_message:
+            yield self._finalize_message(
+                current_message, content_lines, current_date, channel_name
+            )
+
+    def _parse_file_since(
+        self,
+        file_path: Path,
+        channel_name: str,
+        since: str,
+        skipped: Optional[Dict[str, int]]
+    ) -> Generator[ParsedMessage, None, None]:
+        """Parse only the date sections after since from a mapped file.
+
+        A date header always ends the pending message, so each section
+        parses on its own. Sections dated on or before since (and any
+        lines before the first date header) are never decoded; only their
+        message headers are counted into skipped.
+
+        Args:
+            file_path: Path to messages.md file.
+            channel_name: Channel name.
+            since: Last date (YYYY-MM-DD) already processed.
+            skipped: Optional dict filled with date -> skipped message count.
+
+        Yields:
+            ParsedMessage objects dated after since.
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                return
+
+        with mm:
+            if mm.find(b'\r') != -1:
+                # Text mode would translate \r line endings; parse as text
+                # and filter by date instead
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for msg in self._parse_lines(f, channel_name):
+                        if msg.date_str > since:
+                            yield msg
+                        elif skipped is not None:
+                            skipped[msg.date_str] = skipped.get(msg.date_str, 0) + 1
+                return
+
+            # (date, start, end) of the text under each date header
+            sections: List[Tuple[str, int, int]] = []
+            date = ""
+            start = 0
+            for match in DATE_HEADER_BYTES_PATTERN.finditer(mm):
+                sections.append((date, start, match.start()))
+                date = match.group(1).decode('ascii')
+                start = match.end() + 1
+            sections.append((date, start, len(mm)))
+
+            for date, start, end in sections:
+                if date > since:
+                    text = mm[start:end].decode('utf-8')
+                    if text.endswith('\n'):
+                        text = text[:-1]
+                    yield from self._parse_lines(text.split('\n'), channel_name, date)
+                elif skipped is not None:
+                    count = 0
+                    for match in MESSAGE_HEADER_BYTES_PATTERN.finditer(mm, start, end):
+                        if MESSAGE_HEADER_PATTERN.match(match.group().decode('utf-8')):
+                            count += 1
+                    if count:
+                        skipped[date] = skipped.get(date, 0) + count
 
     def _finalize_message(
         self,
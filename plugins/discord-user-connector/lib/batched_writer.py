@@ -6,7 +6,7 @@ with periodic flush for progressive data availability.
 
 import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime, date, timezone
+from datetime import datetime, date
 from typing import Callable, Dict, List, Optional
 
 from .storage import Storage, SyncMode
@@ -150,68 +150,17 @@ class BatchedWriter:
     def _write_messages_only(self, buffer: ChannelBuffer) -> None:
         """Write messages to file without updating sync state.
 
-        This is a simplified version of storage.append_messages that
+        Uses storage.write_messages, which unlike append_messages
         doesn't call update_channel_sync_state (we batch those).
         """
-        if not buffer.messages:
-            return
-
-        # Use storage's internal methods for file writing
-        safe_name = self._storage._sanitize_name(buffer.channel_name)
-        server_dir = self._storage._get_server_dir(buffer.server_id, buffer.server_name)
-        channel_dir = server_dir / safe_name
-        self._storage._ensure_dir(channel_dir)
-
-        messages_file = channel_dir / "messages.md"
-
-        # Import formatters
-        from .markdown_formatter import (
-            format_channel_header,
-            format_date_header,
-            format_message,
-            group_messages_by_date
+        self._storage.write_messages(
+            server_id=buffer.server_id,
+            server_name=buffer.server_name,
+            channel_id=buffer.channel_id,
+            channel_name=buffer.channel_name,
+            messages=buffer.messages,
         )
 
-        # Group messages by date
-        date_groups = group_messages_by_date(buffer.messages)
-
-        # Create file with header if it doesn't exist
-        if not messages_file.exists():
-            now = datetime.now(timezone.utc).isoformat()
-            header = format_channel_header(
-                channel_name=buffer.channel_name,
-                channel_id=buffer.channel_id,
-                server_name=buffer.server_name,
-                server_id=buffer.server_id,
-                last_sync=now
-            )
-            with open(messages_file, "w") as f:
-                f.write(header)
-
-        # Build content to append
-        new_lines = []
-        sorted_dates = sorted(date_groups.keys())
-
-        for date_str in sorted_dates:
-            date_header = format_date_header(date_str)
-            new_lines.append("")
-            new_lines.append(date_header)
-            new_lines.append("")
-
-            # Sort messages by timestamp
-            day_messages = sorted(
-                date_groups[date_str],
-                key=lambda m: m.get("timestamp", "")
-            )
-
-            for msg in day_messages:
-                new_lines.append(format_message(msg))
-                new_lines.append("")
-
-        # Append to file
-        with open(messages_file, "a") as f:
-            f.write("\n".join(new_lines))
-
     async def flush_all(self) -> Dict[str, int]:
         """Flush all pending buffers and return flush summary.
 
@@ -262,6 +211,11 @@ class BatchedWriter:
                 oldest_message_id=result.get("oldest_message_id"),
             )
 
+        for server_id, server_name in {
+            (r["server_id"], r["server_name"]) for r in channel_results
+        }:
+            self._storage.flush_sync_state(server_id, server_name)
+
     async def start_background_flush(self) -> None:
         """Start background flush task for progressive data availability."""
         if self._running:
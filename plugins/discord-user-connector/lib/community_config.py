@@ -4,6 +4,7 @@ Loads from config/agents.yaml with platform-specific sections.
 """
 
 import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +13,18 @@ from typing import Optional
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Characters not allowed in filenames, mapped to "_"
+_INVALID_CHARS_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# Slug helpers: drop punctuation, collapse whitespace/underscores to "-"
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SPACE_RE = re.compile(r'[\s_]+')
+
 
 class ConfigError(Exception):
     """Configuration error."""
@@ -170,7 +183,7 @@ class CommunityConfig:
             self._create_default_config(filepath)
 
         with open(filepath, "r") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_Loader) or {}
 
     def _create_default_config(self, filepath: Path) -> None:
         """Create default agents.yaml."""
@@ -178,10 +191,10 @@ class CommunityConfig:
         with open(filepath, "w") as f:
             f.write(DEFAULT_CONFIG)
         # Set creation timestamp
-        self._config = yaml.safe_load(DEFAULT_CONFIG) or {}
+        self._config = yaml.load(DEFAULT_CONFIG, Loader=_Loader) or {}
         self._config.setdefault("_meta", {})["created_at"] = datetime.now().isoformat()
         with open(filepath, "w") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=_Dumper, default_flow_style=False)
         print(f"Created default config at {filepath}")
 
     def save_config(self) -> None:
@@ -191,7 +204,7 @@ class CommunityConfig:
         # Update last_run_at timestamp
         self._config.setdefault("_meta", {})["last_run_at"] = datetime.now().isoformat()
         with open(filepath, "w") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=_Dumper, default_flow_style=False)
 
     # -------------------------------------------------------------------------
     # Setup state detection
@@ -635,17 +648,13 @@ class CommunityConfig:
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """Sanitize a string for use as filename."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        return name.lower().strip()
+        return name.translate(_INVALID_CHARS_TABLE).lower().strip()
 
     @staticmethod
     def _slugify(name: str) -> str:
         """Convert a name to a URL-friendly slug."""
-        import re
-        slug = re.sub(r'[^\w\s-]', '', name.lower())
-        slug = re.sub(r'[\s_]+', '-', slug)
+        slug = _SLUG_STRIP_RE.sub('', name.lower())
+        slug = _SLUG_SPACE_RE.sub('-', slug)
         slug = slug.strip('-')
         return slug[:50]
 
@@ -4,6 +4,7 @@ Self-contained configuration that includes the shared CommunityConfig.
 No external symlinks required - all dependencies are bundled.
 """
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -41,12 +42,12 @@ class Config:
         """Get default server ID from config (optional)."""
         return self._community_config.discord_server_id
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
-        """Get data directory path."""
+        """Get data directory path (resolved once per config instance)."""
         return self._community_config.data_dir
 
-    @property
+    @cached_property
     def retention_days(self) -> int:
         """Get message retention days (default 30)."""
         return self._community_config.discord_retention_days
@@ -144,23 +145,17 @@ class Config:
 
 
 # Global config instance
-_config: Optional[Config] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get global config instance."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
 
 
 def reload_config() -> Config:
     """Reload configuration from files."""
-    global _config
     reload_community_config()
-    _config = Config()
-    return _config
+    get_config.cache_clear()
+    return get_config()
 
 
 # Re-export for backwards compatibility and new features
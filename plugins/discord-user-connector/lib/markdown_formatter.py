@@ -21,9 +21,11 @@ def format_message_header(
     Returns:
         Formatted header string
     """
-    # Parse timestamp and format as "10:30 AM"
+    # Parse timestamp and format as "10:30 AM" (same as strftime("%-I:%M %p")
+    # without the per-call format parsing, and portable beyond glibc)
     dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    time_str = dt.strftime("%-I:%M %p")
+    hour = dt.hour
+    time_str = f"{hour % 12 or 12}:{dt.minute:02d} {'AM' if hour < 12 else 'PM'}"
 
     header = f"### {time_str} - @{author_name} ({author_id})"
 
@@ -236,7 +238,7 @@ def group_messages_by_date(messages: List[dict]) -> dict:
 
         # Extract date from ISO timestamp
         dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        date_str = dt.strftime("%Y-%m-%d")
+        date_str = dt.date().isoformat()
 
         if date_str not in groups:
             groups[date_str] = []
@@ -245,6 +247,26 @@ def group_messages_by_date(messages: List[dict]) -> dict:
     return groups
 
 
+def group_messages_by_date_sorted(messages: List[dict]) -> dict:
+    """Group messages by date, with each day's messages in timestamp order.
+
+    Sorts the whole batch at most once (Discord history usually arrives
+    already ascending, in which case no sort happens) rather than sorting
+    every day's group separately.
+
+    Args:
+        messages: List of message dicts with timestamps
+
+    Returns:
+        Dict mapping date strings to timestamp-ordered lists of messages
+    """
+    timestamps = [msg.get("timestamp", "") for msg in messages]
+    if any(a > b for a, b in zip(timestamps, timestamps[1:])):
+        messages = sorted(messages, key=lambda m: m.get("timestamp", ""))
+
+    return group_messages_by_date(messages)
+
+
 def format_messages_markdown(
     messages: List[dict],
     channel_name: str,
@@ -278,8 +300,8 @@ def format_messages_markdown(
     )
     lines.append(header)
 
-    # Group messages by date
-    date_groups = group_messages_by_date(messages)
+    # Group messages by date (oldest first within each date for readability)
+    date_groups = group_messages_by_date_sorted(messages)
 
     # Sort dates in reverse order (newest first)
     sorted_dates = sorted(date_groups.keys(), reverse=True)
@@ -288,13 +310,7 @@ def format_messages_markdown(
         lines.append(format_date_header(date_str))
         lines.append("")
 
-        # Sort messages within date by timestamp (oldest first for readability)
-        day_messages = sorted(
-            date_groups[date_str],
-            key=lambda m: m.get("timestamp", "")
-        )
-
-        for msg in day_messages:
+        for msg in date_groups[date_str]:
             lines.append(format_message(msg))
             lines.append("")
 
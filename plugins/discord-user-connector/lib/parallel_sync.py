@@ -135,7 +135,12 @@ class ParallelSyncOrchestrator:
         tasks = [self._sync_channel_with_semaphore(channel, limit) for channel in channels]
 
         # Execute all channels (parallelism controlled by semaphore)
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Compact per-channel sync state updates into sync_state.json,
+            # even if the sync is cancelled
+            self.storage.flush_sync_state(self.server_id, self.server_name)
 
         # Calculate duration
         duration = (datetime.now(timezone.utc) - self._start_time).total_seconds()
@@ -319,7 +324,7 @@ class ParallelSyncOrchestrator:
 
         # Save messages if any
         if messages:
-            self.storage.append_messages(
+            await self.storage.aappend_messages(
                 server_id=self.server_id,
                 server_name=self.server_name,
                 channel_id=channel_id,
@@ -1,19 +1,36 @@
 """Storage service for Markdown/YAML file I/O."""
 
+import asyncio
+import copy
+import json
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, date, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+    HAS_LIBYAML = False
+
 from .config import get_config
 from .markdown_formatter import (
     format_channel_header,
     format_date_header,
     format_message,
-    group_messages_by_date
+    group_messages_by_date_sorted
 )
 
 
@@ -29,6 +46,301 @@ class SyncMode(Enum):
 # Default message limit for DMs (privacy-conscious)
 DM_DEFAULT_LIMIT = 100
 
+# Parsed YAML/JSON files keyed by path -> (st_mtime_ns, st_size, data).
+# Bounded LRU so long-running syncs over many servers don't grow unbounded.
+_PARSE_CACHE_MAX_ENTRIES = 512
+_parse_cache: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+# update_manifest reads from worker threads
+_parse_cache_lock = threading.Lock()
+
+
+def _cache_parsed(path: str, st: os.stat_result, data: dict) -> None:
+    """Remember parsed data for a file at its current stat signature."""
+    with _parse_cache_lock:
+        _parse_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        _parse_cache.move_to_end(path)
+        if len(_parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.popitem(last=False)
+
+
+def _load_cached(path: Path, parse: Callable[[bytes], dict]) -> Optional[dict]:
+    """Load a mapping file, reusing the last parse while the file is unchanged.
+
+    The returned dict is shared with the cache - callers must copy before
+    mutating it.
+
+    Args:
+        path: File to load
+        parse: Parser for the raw file bytes
+
+    Returns:
+        Parsed dict, or None if the file doesn't exist
+    """
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        with _parse_cache_lock:
+            _parse_cache.pop(key, None)
+        return None
+
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _parse_cache.move_to_end(key)
+            return cached[2]
+
+    with open(key, "rb") as f:
+        data = parse(f.read()) or {}
+    _cache_parsed(key, st, data)
+    return data
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Load a YAML mapping through the parse cache.
+
+    Returns:
+        Parsed dict, or empty dict if the file doesn't exist
+    """
+    data = _load_cached(path, lambda raw: yaml.load(raw, Loader=_Loader))
+    return {} if data is None else data
+
+
+def _save_yaml_cached(path: Path, data: dict) -> None:
+    """Write a YAML mapping and prime the cache so the next read skips disk.
+
+    A copy is cached, so the caller may keep mutating its dict.
+
+    Args:
+        path: YAML file to write
+        data: Dict to serialize
+    """
+    key = os.fspath(path)
+    with open(key, "w") as f:
+        yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+    _cache_parsed(key, os.stat(key), copy.deepcopy(data))
+
+
+def _save_json_cached(path: Path, data: dict) -> None:
+    """Write a JSON mapping in one write and prime the parse cache.
+
+    A copy is cached, so the caller may keep mutating its dict.
+
+    Args:
+        path: JSON file to write
+        data: Dict to serialize
+    """
+    key = os.fspath(path)
+    with open(key, "wb") as f:
+        f.write(json.dumps(data, indent=2).encode("utf-8"))
+    _cache_parsed(key, os.stat(key), copy.deepcopy(data))
+
+
+# Canonical sync state. sync_state.yaml is still written alongside it as a
+# human/agent-readable export, and read only as a fallback for servers
+# synced before the JSON file existed.
+SYNC_STATE_FILE = "sync_state.json"
+
+
+# Per-channel sync state updates are appended here during a sync and
+# compacted into the sync state snapshot once at the end (see flush_sync_state).
+SYNC_STATE_JOURNAL = "sync_state.journal.jsonl"
+
+# Replayed journals keyed by path -> (st_size, overlay). The journal is
+# append-only, so size alone tells us whether new records were added.
+_journal_cache: Dict[str, tuple] = {}
+
+
+def _apply_journal_record(overlay: dict, record: dict) -> None:
+    """Replay one journal record onto an overlay (last write wins per channel)."""
+    for key in ("server_id", "server_name", "last_sync"):
+        if key in record:
+            overlay[key] = record[key]
+    overlay.setdefault("channels", {})[record["channel"]] = record["state"]
+
+
+def _load_journal(path: Path) -> dict:
+    """Replay a sync state journal into an overlay dict.
+
+    The returned dict is shared with the cache - callers must copy before
+    mutating it.
+
+    Args:
+        path: Journal file to replay
+
+    Returns:
+        Overlay dict, or empty dict if there is no journal
+    """
+    key = os.fspath(path)
+    try:
+        size = os.stat(key).st_size
+    except FileNotFoundError:
+        _journal_cache.pop(key, None)
+        return {}
+
+    cached = _journal_cache.get(key)
+    if cached is not None and cached[0] == size:
+        return cached[1]
+
+    overlay: dict = {}
+    with open(key, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write from an interrupted sync - skip it
+                continue
+            _apply_journal_record(overlay, record)
+    _journal_cache[key] = (size, overlay)
+    return overlay
+
+
+def _append_journal(path: Path, record: dict) -> None:
+    """Append one record to a sync state journal.
+
+    Args:
+        path: Journal file
+        record: Record with server fields, "channel" and "state"
+    """
+    key = os.fspath(path)
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    with open(key, "ab") as f:
+        f.write(line)
+        size = f.tell()
+
+    # Extend the cached replay instead of re-reading the whole journal
+    cached = _journal_cache.get(key)
+    if cached is not None and cached[0] + len(line) == size:
+        _apply_journal_record(cached[1], record)
+        _journal_cache[key] = (size, cached[1])
+    else:
+        _journal_cache.pop(key, None)
+
+
+def _load_sync_state(server_dir: Path) -> dict:
+    """Load a server's sync state snapshot with any journaled updates applied.
+
+    Args:
+        server_dir: Server directory
+
+    Returns:
+        Sync state dict, or empty dict if not found
+    """
+    state = _load_cached(server_dir / SYNC_STATE_FILE, json.loads)
+    if state is None:
+        state = _load_yaml_cached(server_dir / "sync_state.yaml")
+    overlay = _load_journal(server_dir / SYNC_STATE_JOURNAL)
+    if not overlay:
+        return state
+
+    merged = dict(state)
+    for key, value in overlay.items():
+        if key != "channels":
+            merged[key] = value
+    merged["channels"] = {**(state.get("channels") or {}), **overlay["channels"]}
+    return merged
+
+
+# Write buffer for messages.md appends, so the header and a whole batch
+# go out in a single write
+_APPEND_BUFFER_SIZE = 1 << 20
+
+# Write buffer for manifest.yaml, which grows with every server and channel
+_MANIFEST_BUFFER_SIZE = 1 << 20
+
+# Thread cap for loading per-server state in update_manifest
+_MANIFEST_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Characters not allowed in directory/file names, mapped to "_"
+_INVALID_CHARS_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# Slug helpers: drop punctuation, collapse whitespace/underscores to "-"
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SPACE_RE = re.compile(r'[\s_]+')
+
+# Markdown structure of messages.md: "### " starts a message block,
+# "# " / "## " are the channel and date headers that end one.
+_MSG_HEADER_RE = re.compile(rb"^### ", re.MULTILINE)
+_SECTION_RE = re.compile(r"^(#{1,3}) ", re.MULTILINE)
+
+# Sidecar next to messages.md mapping date -> byte offset of its "## date"
+# section, so sections can later be located without scanning the file.
+MESSAGES_INDEX = "messages.idx"
+
+
+def _load_messages_index(path: Path) -> Optional[dict]:
+    """Load a messages.idx sidecar.
+
+    Args:
+        path: Index file
+
+    Returns:
+        Date -> offset dict, or None if the messages file predates the index
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+# Timestamp shared by everything written during one append_messages call,
+# so a batch formats datetime.now() once instead of per metadata field
+_sync_clock = threading.local()
+
+
+def set_sync_timestamp(timestamp: Optional[str]) -> None:
+    """Pin the ISO timestamp used for sync bookkeeping on this thread.
+
+    Args:
+        timestamp: ISO 8601 timestamp, or None to go back to the live clock
+    """
+    _sync_clock.timestamp = timestamp
+
+
+def current_sync_timestamp() -> str:
+    """Get the pinned sync timestamp, or the current UTC time if none is set."""
+    timestamp = getattr(_sync_clock, "timestamp", None)
+    if timestamp is None:
+        return datetime.now(timezone.utc).isoformat()
+    return timestamp
+
+
+def _write_date_sections(
+    f: BinaryIO,
+    date_groups: dict,
+    offset: int = 0,
+    index: Optional[dict] = None
+) -> None:
+    """Stream date sections into an open binary file, oldest date first.
+
+    Writes straight into the file's buffer rather than building and joining
+    the whole batch in memory. The layout is a blank line, "## date", a
+    blank line, then each message followed by a blank line.
+
+    Args:
+        f: File opened for binary append
+        date_groups: Date string -> timestamp-ordered messages
+        offset: Current end of file, for index bookkeeping
+        index: Optional date -> offset map; new dates get their header offset
+    """
+    for i, date_str in enumerate(sorted(date_groups.keys())):
+        # Blank line separating this section from the previous one
+        if i:
+            f.write(b"\n")
+            offset += 1
+
+        date_header = format_date_header(date_str).encode("utf-8")
+        if index is not None:
+            index.setdefault(date_str, offset + 1)
+        f.write(b"\n" + date_header + b"\n")
+        offset += len(date_header) + 2
+
+        for msg in date_groups[date_str]:
+            line = format_message(msg).encode("utf-8")
+            f.write(b"\n" + line + b"\n")
+            offset += len(line) + 2
+
 
 @dataclass
 class SyncProgress:
@@ -102,6 +414,13 @@ class Storage:
             self._servers_dir = self._base_dir
             self._dm_base_dir = self._base_dir.parent / "dms" / "discord"
 
+        # ID -> server/DM directory, filled by scandir and new slug dirs
+        self._server_dirs: Dict[str, Path] = {}
+        self._dm_dirs: Dict[str, Path] = {}
+
+        # Servers whose state changed since the last manifest update
+        self._dirty_servers: set = set()
+
     def _detect_storage_version(self) -> int:
         """Detect current storage structure version.
 
@@ -225,7 +544,9 @@ class Storage:
         if not dry_run and not report["errors"]:
             self._storage_version = 2
             self._servers_dir = new_servers_dir
+            self._server_dirs = {}
             self._dm_base_dir = new_dm_dir
+            self._dm_dirs = {}
             # Regenerate manifests at new locations
             self.update_manifest()
             self.update_dm_manifest()
@@ -238,22 +559,31 @@ class Storage:
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for use as directory/filename."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        return name.lower().strip()
+        return name.translate(_INVALID_CHARS_TABLE).lower().strip()
 
     def _slugify(self, name: str) -> str:
         """Convert a name to a URL-friendly slug."""
-        import re
         # Remove special characters, keep alphanumeric and spaces
-        slug = re.sub(r'[^\w\s-]', '', name.lower())
+        slug = _SLUG_STRIP_RE.sub('', name.lower())
         # Replace spaces with hyphens
-        slug = re.sub(r'[\s_]+', '-', slug)
+        slug = _SLUG_SPACE_RE.sub('-', slug)
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
         return slug
 
+    @staticmethod
+    def _scan_id_dirs(parent: Path) -> Dict[str, Path]:
+        """Map IDs to their existing {id}-{slug} directories with a single scandir."""
+        id_dirs: Dict[str, Path] = {}
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        id_dirs.setdefault(entry.name.partition("-")[0], Path(entry.path))
+        except FileNotFoundError:
+            pass
+        return id_dirs
+
     def _get_server_dir(self, server_id: str, server_name: Optional[str] = None) -> Path:
         """Get server directory path with human-readable slug.
 
@@ -267,16 +597,24 @@ class Storage:
         Returns:
             Path to server directory
         """
-        # Try to find existing directory first (may already have slug)
-        if self._servers_dir.exists():
-            for existing in self._servers_dir.glob(f"{server_id}*"):
-                if existing.is_dir():
-                    return existing
-
-        # Build new directory name with slug
+        cached = self._server_dirs.get(server_id)
+        if cached is not None:
+            return cached
+
+        # Try to find existing directory first (may already have slug).
+        # Rescan on a miss in case the directory was created since.
+        self._server_dirs.update(self._scan_id_dirs(self._servers_dir))
+        existing = self._server_dirs.get(server_id)
+        if existing is not None:
+            return existing
+
+        # Build new directory name with slug, and remember it so later
+        # lookups (with or without the name) resolve to the same place
         if server_name:
             slug = self._slugify(server_name)
-            return self._servers_dir / f"{server_id}-{slug}"
+            server_dir = self._servers_dir / f"{server_id}-{slug}"
+            self._server_dirs[server_id] = server_dir
+            return server_dir
 
         # Fallback to just server_id
         return self._servers_dir / server_id
@@ -291,19 +629,18 @@ class Storage:
             server_name: Optional server name for directory lookup
 
         Returns:
-            Sync state dict, or empty dict if not found
+            Sync state dict, or empty dict if not found. The dict is the
+            caller's own copy and may be mutated freely.
         """
         server_dir = self._get_server_dir(server_id, server_name)
-        state_file = server_dir / "sync_state.yaml"
-        if not state_file.exists():
-            return {}
-
-        with open(state_file, "r") as f:
-            return yaml.safe_load(f) or {}
+        return copy.deepcopy(_load_sync_state(server_dir))
 
     def save_sync_state(self, server_id: str, state: dict, server_name: Optional[str] = None):
         """Save sync state for a server.
 
+        The state is written as a full snapshot, so any pending journal
+        entries are discarded.
+
         Args:
             server_id: Discord server ID
             state: Sync state dict
@@ -312,9 +649,32 @@ class Storage:
         server_dir = self._get_server_dir(server_id, server_name or state.get("server_name"))
         self._ensure_dir(server_dir)
 
-        state_file = server_dir / "sync_state.yaml"
-        with open(state_file, "w") as f:
-            yaml.safe_dump(state, f, default_flow_style=False)
+        _save_json_cached(server_dir / SYNC_STATE_FILE, state)
+        _save_yaml_cached(server_dir / "sync_state.yaml", state)
+        self._dirty_servers.add(str(server_id))
+
+        journal = server_dir / SYNC_STATE_JOURNAL
+        _journal_cache.pop(os.fspath(journal), None)
+        try:
+            os.unlink(journal)
+        except FileNotFoundError:
+            pass
+
+    def flush_sync_state(self, server_id: str, server_name: Optional[str] = None) -> None:
+        """Compact journaled channel updates into sync_state.json.
+
+        sync_state.json is the authoritative snapshot; sync_state.yaml is
+        rewritten alongside it as a read-only export. Call once at the end
+        of a sync. No-op if nothing was journaled.
+
+        Args:
+            server_id: Discord server ID
+            server_name: Optional server name for directory lookup
+        """
+        server_dir = self._get_server_dir(server_id, server_name)
+        if not (server_dir / SYNC_STATE_JOURNAL).exists():
+            return
+        self.save_sync_state(server_id, _load_sync_state(server_dir), server_name)
 
     def get_channel_sync_state(
         self,
@@ -349,6 +709,10 @@ class Storage:
     ):
         """Update sync state for a channel.
 
+        The update is journaled; call flush_sync_state() at the end of the
+        sync to write it into sync_state.json (the authoritative snapshot,
+        with sync_state.yaml kept as an export).
+
         Args:
             server_id: Discord server ID
             server_name: Server display name
@@ -361,19 +725,10 @@ class Storage:
             newest_synced_date: Newest date in synced range
             oldest_message_id: Oldest message ID synced
         """
-        state = self.get_sync_state(server_id)
-
-        # Update server info
-        state["server_id"] = server_id
-        state["server_name"] = server_name
-        state["last_sync"] = datetime.now(timezone.utc).isoformat()
-
-        # Update channel info
-        if "channels" not in state:
-            state["channels"] = {}
+        state = self.get_sync_state(server_id, server_name)
 
         safe_name = self._sanitize_name(channel_name)
-        existing = state["channels"].get(safe_name, {})
+        existing = (state.get("channels") or {}).get(safe_name, {})
         existing_count = existing.get("message_count", 0)
 
         # Preserve and extend date ranges
@@ -394,19 +749,31 @@ class Storage:
         elif existing_newest:
             newest_synced_date = date.fromisoformat(existing_newest)
 
-        state["channels"][safe_name] = {
+        now = current_sync_timestamp()
+        channel_state = {
             "id": channel_id,
             "name": channel_name,
             "message_count": existing_count + message_count,
             "last_message_id": last_message_id,
-            "last_sync_at": datetime.now(timezone.utc).isoformat(),
+            "last_sync_at": now,
             "sync_mode": sync_mode.value if sync_mode else existing.get("sync_mode"),
             "oldest_synced_date": oldest_synced_date.isoformat() if oldest_synced_date else None,
             "newest_synced_date": newest_synced_date.isoformat() if newest_synced_date else None,
             "oldest_message_id": oldest_message_id or existing.get("oldest_message_id")
         }
 
-        self.save_sync_state(server_id, state)
+        # Append to the journal rather than rewriting sync_state.yaml per batch;
+        # flush_sync_state() compacts it at the end of the sync
+        server_dir = self._get_server_dir(server_id, server_name)
+        self._ensure_dir(server_dir)
+        _append_journal(server_dir / SYNC_STATE_JOURNAL, {
+            "server_id": server_id,
+            "server_name": server_name,
+            "last_sync": now,
+            "channel": safe_name,
+            "state": channel_state,
+        })
+        self._dirty_servers.add(str(server_id))
 
     def has_any_sync(self, server_id: str) -> bool:
         """Check if a server has any previous sync data.
@@ -488,7 +855,7 @@ class Storage:
         channel_dir = server_dir / safe_name
         return channel_dir / "messages.md"
 
-    def append_messages(
+    def write_messages(
         self,
         server_id: str,
         server_name: str,
@@ -496,7 +863,13 @@ class Storage:
         channel_name: str,
         messages: List[dict]
     ):
-        """Append messages to a channel's messages file.
+        """Append formatted messages to a channel's messages file.
+
+        Does not touch sync state - see append_messages().
+
+        Messages are always appended at the end, so the existing file is
+        never read. The byte offset of each date section is recorded in a
+        messages.idx sidecar for files created with one.
 
         Args:
             server_id: Discord server ID
@@ -514,70 +887,72 @@ class Storage:
         self._ensure_dir(channel_dir)
 
         messages_file = channel_dir / "messages.md"
-
-        # Group messages by date
-        date_groups = group_messages_by_date(messages)
-
-        # If file doesn't exist, create with header
-        if not messages_file.exists():
-            now = datetime.now(timezone.utc).isoformat()
-            header = format_channel_header(
-                channel_name=channel_name,
-                channel_id=channel_id,
-                server_name=server_name,
-                server_id=server_id,
-                last_sync=now
-            )
-            with open(messages_file, "w") as f:
+        index_file = channel_dir / MESSAGES_INDEX
+
+        # Group messages by date, each day already in timestamp order
+        date_groups = group_messages_by_date_sorted(messages)
+
+        with open(messages_file, "ab", buffering=_APPEND_BUFFER_SIZE) as f:
+            offset = f.tell()
+
+            # New file - start with the channel header and a fresh index
+            if offset == 0:
+                now = current_sync_timestamp()
+                header = format_channel_header(
+                    channel_name=channel_name,
+                    channel_id=channel_id,
+                    server_name=server_name,
+                    server_id=server_id,
+                    last_sync=now
+                ).encode("utf-8")
                 f.write(header)
+                offset = len(header)
+                index = {}
+            else:
+                index = _load_messages_index(index_file)
 
-        # Read existing content to find where to insert
-        with open(messages_file, "r") as f:
-            existing_content = f.read()
-
-        # Build new content to append
-        new_lines = []
+            _write_date_sections(f, date_groups, offset, index)
 
-        # Sort dates (oldest first for appending)
-        sorted_dates = sorted(date_groups.keys())
+        if index is not None:
+            with open(index_file, "w") as f:
+                json.dump(index, f, separators=(",", ":"))
 
-        for date_str in sorted_dates:
-            # Check if this date section already exists
-            date_header = format_date_header(date_str)
+    def append_messages(
+        self,
+        server_id: str,
+        server_name: str,
+        channel_id: str,
+        channel_name: str,
+        messages: List[dict]
+    ):
+        """Append messages to a channel's messages file.
 
-            if date_header in existing_content:
-                # Find the date section and append to it
-                # For now, just append at the end of the file
-                pass
+        Args:
+            server_id: Discord server ID
+            server_name: Server display name
+            channel_id: Channel ID
+            channel_name: Channel name
+            messages: List of message dicts to append
+        """
+        if not messages:
+            return
 
-            new_lines.append("")
-            new_lines.append(date_header)
-            new_lines.append("")
+        set_sync_timestamp(datetime.now(timezone.utc).isoformat())
+        try:
+            self.write_messages(server_id, server_name, channel_id, channel_name, messages)
 
-            # Sort messages by timestamp (oldest first)
-            day_messages = sorted(
-                date_groups[date_str],
-                key=lambda m: m.get("timestamp", "")
+            # Update last_message_id tracking
+            last_msg = messages[-1]
+            self.update_channel_sync_state(
+                server_id=server_id,
+                server_name=server_name,
+                channel_name=channel_name,
+                channel_id=channel_id,
+                last_message_id=last_msg["id"],
+                message_count=len(messages)
             )
-
-            for msg in day_messages:
-                new_lines.append(format_message(msg))
-                new_lines.append("")
-
-        # Append to file
-        with open(messages_file, "a") as f:
-            f.write("\n".join(new_lines))
-
-        # Update last_message_id tracking
-        last_msg = messages[-1]
-        self.update_channel_sync_state(
-            server_id=server_id,
-            server_name=server_name,
-            channel_name=channel_name,
-            channel_id=channel_id,
-            last_message_id=last_msg["id"],
-            message_count=len(messages)
-        )
+        finally:
+            set_sync_timestamp(None)
 
     def read_messages(
         self,
@@ -603,34 +978,30 @@ class Storage:
                 f"in server {server_id}. Run sync first."
             )
 
-        with open(messages_file, "r") as f:
-            content = f.read()
-
         if last_n is None:
-            return content
+            with open(messages_file, "r") as f:
+                return f.read()
 
-        # Extract last N message blocks (### headers indicate messages)
-        lines = content.split("\n")
-        message_indices = []
+        # Find message blocks (### headers) with one regex scan over a
+        # memory map, then decode only the header and the last N messages
+        with open(messages_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                message_offsets = [m.start() for m in _MSG_HEADER_RE.finditer(mm)]
 
-        for i, line in enumerate(lines):
-            if line.startswith("### "):
-                message_indices.append(i)
+                if not message_offsets:
+                    return mm[:].decode("utf-8")
 
-        if not message_indices:
-            return content
+                # Get starting offset for last N messages
+                start = message_offsets[-last_n] if len(message_offsets) >= last_n else 0
 
-        # Get starting index for last N messages
-        start_idx = message_indices[-last_n] if len(message_indices) >= last_n else 0
+                # Keep header (everything before first message, minus its newline)
+                header_end = message_offsets[0]
+                header = mm[:header_end - 1] if header_end else b""
+                messages = mm[start:]
 
-        # Keep header (everything before first message)
-        if message_indices:
-            header_end = message_indices[0]
-            header = "\n".join(lines[:header_end])
-            messages = "\n".join(lines[start_idx:])
-            return header + "\n" + messages
-
-        return content
+        return header.decode("utf-8") + "\n" + messages.decode("utf-8")
 
     def search_messages(
         self,
@@ -650,38 +1021,69 @@ class Storage:
         """
         content = self.read_messages(server_id, channel_name)
 
-        # Split into message blocks
-        lines = content.split("\n")
-        current_block = []
-        blocks = []
-        in_message = False
-
-        for line in lines:
-            if line.startswith("### "):
-                if current_block and in_message:
-                    blocks.append("\n".join(current_block))
-                current_block = [line]
-                in_message = True
-            elif line.startswith("## ") or line.startswith("# "):
-                if current_block and in_message:
-                    blocks.append("\n".join(current_block))
-                current_block = []
-                in_message = False
-            elif in_message:
-                current_block.append(line)
-
-        if current_block and in_message:
-            blocks.append("\n".join(current_block))
-
-        # Filter by keyword
+        # Lowercase the whole file once instead of once per block
         keyword_lower = keyword.lower()
-        matches = [
-            block for block in blocks
-            if keyword_lower in block.lower()
-        ]
+        content_lower = content.lower()
+        if keyword_lower not in content_lower:
+            return []
+
+        # Split into message blocks: each ### block runs until the next
+        # #, ## or ### header line (excluding that line's leading newline)
+        sections = [(m.start(), len(m.group(1))) for m in _SECTION_RE.finditer(content)]
+        spans = []
+
+        for i, (start, level) in enumerate(sections):
+            if level != 3:
+                continue
+            end = sections[i + 1][0] - 1 if i + 1 < len(sections) else len(content)
+            spans.append((start, end))
+
+        # Filter by keyword. A few characters change length when lowercased,
+        # in which case offsets into content_lower no longer line up.
+        if len(content_lower) == len(content):
+            matches = [
+                content[start:end] for start, end in spans
+                if content_lower.find(keyword_lower, start, end) != -1
+            ]
+        else:
+            matches = [
+                content[start:end] for start, end in spans
+                if keyword_lower in content[start:end].lower()
+            ]
 
         return matches
 
+    # === Async Wrappers ===
+    # Run the blocking file I/O in a worker thread so concurrent channel
+    # syncs on the event loop can overlap it.
+
+    async def aget_sync_state(self, server_id: str, server_name: Optional[str] = None) -> dict:
+        """Async version of get_sync_state()."""
+        return await asyncio.to_thread(self.get_sync_state, server_id, server_name)
+
+    async def asave_sync_state(
+        self,
+        server_id: str,
+        state: dict,
+        server_name: Optional[str] = None
+    ) -> None:
+        """Async version of save_sync_state()."""
+        await asyncio.to_thread(self.save_sync_state, server_id, state, server_name)
+
+    async def aappend_messages(
+        self,
+        server_id: str,
+        server_name: str,
+        channel_id: str,
+        channel_name: str,
+        messages: List[dict]
+    ) -> None:
+        """Async version of append_messages()."""
+        await asyncio.to_thread(
+            self.append_messages,
+            server_id, server_name, channel_id, channel_name, messages
+        )
+
     # === Health Reports ===
 
     def save_health_report(
@@ -705,7 +1107,7 @@ class Storage:
         # Save YAML report
         yaml_path = server_dir / "health-report.yaml"
         with open(yaml_path, "w") as f:
-            yaml.safe_dump(report_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(report_data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
     def get_health_report(
         self,
@@ -728,7 +1130,7 @@ class Storage:
             return None
 
         with open(yaml_path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_Loader)
 
     def health_report_exists(
         self,
@@ -775,8 +1177,8 @@ class Storage:
             "synced_at": datetime.now(timezone.utc).isoformat()
         }
 
-        with open(server_dir / "server.yaml", "w") as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False)
+        _save_yaml_cached(server_dir / "server.yaml", metadata)
+        self._dirty_servers.add(str(server_id))
 
     def save_channel_metadata(
         self,
@@ -807,12 +1209,102 @@ class Storage:
             "synced_at": datetime.now(timezone.utc).isoformat()
         }
 
-        with open(channel_dir / "channel.yaml", "w") as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False)
+        _save_yaml_cached(channel_dir / "channel.yaml", metadata)
 
 
     # === Manifest (All-in-One Overview) ===
 
+    @staticmethod
+    def _load_manifest_server(server_dir: Path) -> Optional[tuple]:
+        """Build one server's manifest entry from its sync state and metadata.
+
+        Args:
+            server_dir: Server directory
+
+        Returns:
+            (server_entry, oldest_date, newest_date), or None if never synced
+        """
+        # Read sync state (snapshot plus any unflushed journal entries)
+        sync_state = _load_sync_state(server_dir)
+        if not sync_state:
+            return None
+
+        # Read server metadata if available
+        server_meta = _load_yaml_cached(server_dir / "server.yaml")
+
+        # Build channel list
+        channels_data = sync_state.get("channels", {})
+        channels = []
+        server_message_count = 0
+
+        # Track server-wide date range
+        server_oldest_date = None
+        server_newest_date = None
+
+        for channel_key, channel_info in channels_data.items():
+            msg_count = channel_info.get("message_count", 0)
+            server_message_count += msg_count
+
+            # Get channel date range
+            ch_oldest = channel_info.get("oldest_synced_date")
+            ch_newest = channel_info.get("newest_synced_date")
+
+            channel_entry = {
+                "name": channel_info.get("name", channel_key),
+                "id": channel_info.get("id"),
+                "message_count": msg_count,
+                "last_sync": channel_info.get("last_sync_at"),
+                "path": f"discord/servers/{server_dir.name}/{channel_key}/messages.md"
+            }
+
+            # Add date range if available
+            if ch_oldest or ch_newest:
+                channel_entry["date_range"] = {
+                    "first_message": ch_oldest,
+                    "last_message": ch_newest
+                }
+
+                # Update server-wide date range
+                if ch_oldest:
+                    ch_oldest_date = date.fromisoformat(ch_oldest)
+                    if server_oldest_date is None or ch_oldest_date < server_oldest_date:
+                        server_oldest_date = ch_oldest_date
+                if ch_newest:
+                    ch_newest_date = date.fromisoformat(ch_newest)
+                    if server_newest_date is None or ch_newest_date > server_newest_date:
+                        server_newest_date = ch_newest_date
+
+            channels.append(channel_entry)
+
+        # Sort channels by message count (most active first)
+        channels.sort(key=lambda c: c.get("message_count", 0), reverse=True)
+
+        server_entry = {
+            "name": sync_state.get("server_name") or server_meta.get("name"),
+            "id": sync_state.get("server_id") or server_meta.get("id"),
+            "directory": f"discord/servers/{server_dir.name}",
+            "member_count": server_meta.get("member_count"),
+            "icon": server_meta.get("icon"),
+            "last_sync": sync_state.get("last_sync"),
+            "total_messages": server_message_count,
+            "channel_count": len(channels),
+            "channels": channels
+        }
+
+        # Add server-wide date range if available
+        if server_oldest_date or server_newest_date:
+            days_covered = 0
+            if server_oldest_date and server_newest_date:
+                days_covered = (server_newest_date - server_oldest_date).days + 1
+
+            server_entry["date_range"] = {
+                "first_message": server_oldest_date.isoformat() if server_oldest_date else None,
+                "last_message": server_newest_date.isoformat() if server_newest_date else None,
+                "days_covered": days_covered
+            }
+
+        return server_entry, server_oldest_date, server_newest_date
+
     def update_manifest(self):
         """Update the manifest.yaml with overview of all synced data.
 
@@ -822,124 +1314,100 @@ class Storage:
         - Quick access paths
         """
         self._ensure_dir(self._base_dir)
-        manifest_path = self._base_dir / "manifest.yaml"
 
         # Scan all server directories (from _servers_dir, not _base_dir)
         servers = []
         total_messages = 0
         total_channels = 0
 
+        # Overall date coverage across all servers
+        overall_oldest = None
+        overall_newest = None
+
         # Ensure servers dir exists before iterating
         if not self._servers_dir.exists():
             self._ensure_dir(self._servers_dir)
 
-        for server_dir in self._servers_dir.iterdir():
-            if not server_dir.is_dir():
-                continue
+        # scandir entries carry d_type, so is_dir() needs no extra stat
+        with os.scandir(self._servers_dir) as it:
+            server_entries = [
+                entry for entry in it
+                if entry.is_dir() and not entry.name.startswith('.')
+            ]
+
+        # Load servers concurrently - the YAML/JSON reads are file I/O
+        server_dirs = [Path(entry.path) for entry in server_entries]
+        if len(server_dirs) > 1:
+            workers = min(_MANIFEST_MAX_WORKERS, len(server_dirs))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(self._load_manifest_server, server_dirs))
+        else:
+            loaded = [self._load_manifest_server(d) for d in server_dirs]
 
-            # Skip hidden directories
-            if server_dir.name.startswith('.'):
+        for result in loaded:
+            if result is None:
                 continue
+            server_entry, server_oldest_date, server_newest_date = result
 
-            # Read sync state
-            sync_state_file = server_dir / "sync_state.yaml"
-            if not sync_state_file.exists():
-                continue
+            total_messages += server_entry["total_messages"]
+            total_channels += server_entry["channel_count"]
 
-            with open(sync_state_file, "r") as f:
-                sync_state = yaml.safe_load(f) or {}
-
-            # Read server metadata if available
-            server_yaml = server_dir / "server.yaml"
-            server_meta = {}
-            if server_yaml.exists():
-                with open(server_yaml, "r") as f:
-                    server_meta = yaml.safe_load(f) or {}
-
-            # Build channel list
-            channels_data = sync_state.get("channels", {})
-            channels = []
-            server_message_count = 0
-
-            # Track server-wide date range
-            server_oldest_date = None
-            server_newest_date = None
-
-            for channel_key, channel_info in channels_data.items():
-                msg_count = channel_info.get("message_count", 0)
-                server_message_count += msg_count
-
-                # Get channel date range
-                ch_oldest = channel_info.get("oldest_synced_date")
-                ch_newest = channel_info.get("newest_synced_date")
-
-                channel_entry = {
-                    "name": channel_info.get("name", channel_key),
-                    "id": channel_info.get("id"),
-                    "message_count": msg_count,
-                    "last_sync": channel_info.get("last_sync_at"),
-                    "path": f"discord/servers/{server_dir.name}/{channel_key}/messages.md"
-                }
+            # Update overall date coverage from the parsed dates
+            if server_oldest_date and (overall_oldest is None or server_oldest_date < overall_oldest):
+                overall_oldest = server_oldest_date
+            if server_newest_date and (overall_newest is None or server_newest_date > overall_newest):
+                overall_newest = server_newest_date
 
-                # Add date range if available
-                if ch_oldest or ch_newest:
-                    channel_entry["date_range"] = {
-                        "first_message": ch_oldest,
-                        "last_message": ch_newest
-                    }
-
-                    # Update server-wide date range
-                    if ch_oldest:
-                        ch_oldest_date = date.fromisoformat(ch_oldest)
-                        if server_oldest_date is None or ch_oldest_date < server_oldest_date:
-                            server_oldest_date = ch_oldest_date
-                    if ch_newest:
-                        ch_newest_date = date.fromisoformat(ch_newest)
-                        if server_newest_date is None or ch_newest_date > server_newest_date:
-                            server_newest_date = ch_newest_date
-
-                channels.append(channel_entry)
-
-            total_messages += server_message_count
-            total_channels += len(channels)
-
-            # Sort channels by message count (most active first)
-            channels.sort(key=lambda c: c.get("message_count", 0), reverse=True)
-
-            server_entry = {
-                "name": sync_state.get("server_name") or server_meta.get("name"),
-                "id": sync_state.get("server_id") or server_meta.get("id"),
-                "directory": f"discord/servers/{server_dir.name}",
-                "member_count": server_meta.get("member_count"),
-                "icon": server_meta.get("icon"),
-                "last_sync": sync_state.get("last_sync"),
-                "total_messages": server_message_count,
-                "channel_count": len(channels),
-                "channels": channels
-            }
+            servers.append(server_entry)
 
-            # Add server-wide date range if available
-            if server_oldest_date or server_newest_date:
-                days_covered = 0
-                if server_oldest_date and server_newest_date:
-                    days_covered = (server_newest_date - server_oldest_date).days + 1
+        manifest = self._write_manifest(
+            servers, total_messages, total_channels, overall_oldest, overall_newest
+        )
+        self._dirty_servers.clear()
+        return manifest
 
-                server_entry["date_range"] = {
-                    "first_message": server_oldest_date.isoformat() if server_oldest_date else None,
-                    "last_message": server_newest_date.isoformat() if server_newest_date else None,
-                    "days_covered": days_covered
-                }
+    def update_manifest_incremental(self) -> dict:
+        """Update manifest.yaml by re-reading only servers changed since the last update.
 
-            servers.append(server_entry)
+        Servers whose sync state or metadata was saved through this Storage
+        are rebuilt; every other entry is carried over from the existing
+        manifest. Falls back to a full update_manifest() when there is no
+        manifest yet.
 
-        # Sort servers by total messages (most active first)
-        servers.sort(key=lambda s: s.get("total_messages", 0), reverse=True)
+        Returns:
+            The updated manifest dict
+        """
+        manifest_path = self._base_dir / "manifest.yaml"
+        if not manifest_path.exists():
+            return self.update_manifest()
+
+        with open(manifest_path, "rb") as f:
+            previous = yaml.load(f, Loader=_Loader) or {}
+        if not self._dirty_servers:
+            return previous
+
+        dirty = self._dirty_servers
+        servers = [
+            s for s in previous.get("servers") or []
+            if str(s.get("id")) not in dirty
+        ]
 
-        # Calculate overall date coverage across all servers
+        for server_id in dirty:
+            server_dir = self._get_server_dir(server_id)
+            if server_dir.is_dir():
+                result = self._load_manifest_server(server_dir)
+                if result is not None:
+                    servers.append(result[0])
+
+        # Re-total across carried-over and rebuilt entries
+        total_messages = 0
+        total_channels = 0
         overall_oldest = None
         overall_newest = None
         for s in servers:
-            dr = s.get("date_range", {})
+            total_messages += s.get("total_messages", 0)
+            total_channels += s.get("channel_count", 0)
+            dr = s.get("date_range") or {}
             if dr.get("first_message"):
                 s_oldest = date.fromisoformat(dr["first_message"])
                 if overall_oldest is None or s_oldest < overall_oldest:
@@ -949,6 +1417,28 @@ class Storage:
                 if overall_newest is None or s_newest > overall_newest:
                     overall_newest = s_newest
 
+        manifest = self._write_manifest(
+            servers, total_messages, total_channels, overall_oldest, overall_newest
+        )
+        dirty.clear()
+        return manifest
+
+    def _write_manifest(
+        self,
+        servers: List[dict],
+        total_messages: int,
+        total_channels: int,
+        overall_oldest: Optional[date],
+        overall_newest: Optional[date]
+    ) -> dict:
+        """Sort server entries, add the summary and write manifest.yaml.
+
+        Returns:
+            The manifest dict that was written
+        """
+        # Sort servers by total messages (most active first)
+        servers.sort(key=lambda s: s.get("total_messages", 0), reverse=True)
+
         overall_days = 0
         if overall_oldest and overall_newest:
             overall_days = (overall_newest - overall_oldest).days + 1
@@ -969,9 +1459,13 @@ class Storage:
             "servers": servers
         }
 
-        # Write manifest
-        with open(manifest_path, "w") as f:
-            yaml.safe_dump(manifest, f, default_flow_style=False, sort_keys=False)
+        # Write manifest - libyaml emits UTF-8 straight into a large buffer
+        manifest_path = self._base_dir / "manifest.yaml"
+        with open(manifest_path, "wb", buffering=_MANIFEST_BUFFER_SIZE) as f:
+            yaml.dump(
+                manifest, f, Dumper=_Dumper, encoding="utf-8",
+                default_flow_style=False, sort_keys=False
+            )
 
         return manifest
 
@@ -986,7 +1480,7 @@ class Storage:
             return self.update_manifest()
 
         with open(manifest_path, "r") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_Loader) or {}
 
     # === DM Storage ===
 
@@ -1003,15 +1497,23 @@ class Storage:
         Returns:
             Path to DM directory
         """
-        # Try to find existing directory first
-        for existing in self._dm_base_dir.glob(f"{user_id}*"):
-            if existing.is_dir():
-                return existing
+        user_id = str(user_id)
+        cached = self._dm_dirs.get(user_id)
+        if cached is not None:
+            return cached
+
+        # Try to find existing directory first (rescan on a miss)
+        self._dm_dirs.update(self._scan_id_dirs(self._dm_base_dir))
+        existing = self._dm_dirs.get(user_id)
+        if existing is not None:
+            return existing
 
         # Build new directory name with slug
         if username:
             slug = self._slugify(username)
-            return self._dm_base_dir / f"{user_id}-{slug}"
+            dm_dir = self._dm_base_dir / f"{user_id}-{slug}"
+            self._dm_dirs[user_id] = dm_dir
+            return dm_dir
 
         # Fallback to just user_id
         return self._dm_base_dir / str(user_id)
@@ -1042,8 +1544,7 @@ class Storage:
             "synced_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        with open(dm_dir / "user.yaml", "w") as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False)
+        _save_yaml_cached(dm_dir / "user.yaml", metadata)
 
     def get_dm_sync_state(self, user_id: str, username: Optional[str] = None) -> dict:
         """Get sync state for a DM.
@@ -1053,15 +1554,11 @@ class Storage:
             username: Optional username for directory lookup
 
         Returns:
-            Sync state dict, or empty dict if not found
+            Sync state dict, or empty dict if not found. The dict is the
+            caller's own copy and may be mutated freely.
         """
         dm_dir = self._get_dm_dir(user_id, username)
-        state_file = dm_dir / "sync_state.yaml"
-        if not state_file.exists():
-            return {}
-
-        with open(state_file, "r") as f:
-            return yaml.safe_load(f) or {}
+        return copy.deepcopy(_load_yaml_cached(dm_dir / "sync_state.yaml"))
 
     def save_dm_sync_state(self, user_id: str, state: dict, username: Optional[str] = None) -> None:
         """Save sync state for a DM.
@@ -1074,9 +1571,7 @@ class Storage:
         dm_dir = self._get_dm_dir(user_id, username or state.get("username"))
         self._ensure_dir(dm_dir)
 
-        state_file = dm_dir / "sync_state.yaml"
-        with open(state_file, "w") as f:
-            yaml.safe_dump(state, f, default_flow_style=False)
+        _save_yaml_cached(dm_dir / "sync_state.yaml", state)
 
     def get_dm_last_message_id(self, user_id: str) -> Optional[str]:
         """Get last synced message ID for DM incremental sync.
@@ -1115,14 +1610,15 @@ class Storage:
 
         messages_file = dm_dir / "messages.md"
 
-        # Group messages by date
-        date_groups = group_messages_by_date(messages)
+        # Group messages by date, each day already in timestamp order
+        date_groups = group_messages_by_date_sorted(messages)
 
-        # If file doesn't exist, create with header
-        if not messages_file.exists():
-            now = datetime.now(timezone.utc).isoformat()
+        # Append to file, creating it with a header if it's new
+        with open(messages_file, "ab", buffering=_APPEND_BUFFER_SIZE) as f:
+            if f.tell() == 0:
+                now = datetime.now(timezone.utc).isoformat()
 
-            header = f"""---
+                header = f"""---
 user_id: {user_id}
 username: {username}
 display_name: {display_name}
@@ -1135,37 +1631,13 @@ last_sync: {now}
 # DM with {display_name}
 
 """
-            with open(messages_file, "w") as f:
-                f.write(header)
-
-        # Build new content to append
-        new_lines = []
+                f.write(header.encode("utf-8"))
 
-        # Sort dates (oldest first for appending)
-        sorted_dates = sorted(date_groups.keys())
-
-        for date_str in sorted_dates:
-            new_lines.append("")
-            new_lines.append(format_date_header(date_str))
-            new_lines.append("")
-
-            # Sort messages by timestamp (oldest first)
-            day_messages = sorted(
-                date_groups[date_str],
-                key=lambda m: m.get("timestamp", "")
-            )
-
-            for msg in day_messages:
-                new_lines.append(format_message(msg))
-                new_lines.append("")
-
-        # Append to file
-        with open(messages_file, "a") as f:
-            f.write("\n".join(new_lines))
+            _write_date_sections(f, date_groups)
 
         # Update sync state
         last_msg = messages[-1]
-        state = self.get_dm_sync_state(user_id, username)
+        state = dict(self.get_dm_sync_state(user_id, username))
         state["user_id"] = user_id
         state["username"] = username
         state["display_name"] = display_name
@@ -1201,15 +1673,10 @@ last_sync: {now}
             if not sync_state_file.exists():
                 continue
 
-            with open(sync_state_file, "r") as f:
-                sync_state = yaml.safe_load(f) or {}
+            sync_state = _load_yaml_cached(sync_state_file)
 
             # Read user metadata if available
-            user_yaml = dm_dir / "user.yaml"
-            user_meta = {}
-            if user_yaml.exists():
-                with open(user_yaml, "r") as f:
-                    user_meta = yaml.safe_load(f) or {}
+            user_meta = _load_yaml_cached(dm_dir / "user.yaml")
 
             message_count = sync_state.get("message_count", 0)
             total_messages += message_count
@@ -1237,20 +1704,18 @@ last_sync: {now}
             "users": dms,
         }
 
-        # Write manifest
-        with open(manifest_path, "w") as f:
-            yaml.safe_dump(manifest, f, default_flow_style=False, sort_keys=False)
+        # Write manifest - libyaml emits UTF-8 straight into a large buffer
+        with open(manifest_path, "wb", buffering=_MANIFEST_BUFFER_SIZE) as f:
+            yaml.dump(
+                manifest, f, Dumper=_Dumper, encoding="utf-8",
+                default_flow_style=False, sort_keys=False
+            )
 
         return manifest
 
 
 # Global storage instance
-_storage: Optional[Storage] = None
-
-
+@lru_cache(maxsize=1)
 def get_storage() -> Storage:
     """Get global storage instance."""
-    global _storage
-    if _storage is None:
-        _storage = Storage()
-    return _storage
+    return Storage()
@@ -12,6 +12,7 @@ Checks:
     5. Configuration file is valid
     6. Default server is accessible
     7. Data directory is writable
+    8. PyYAML has the libyaml C backend
 
 Output:
     - Diagnostic results with ✓ (pass) or ✗ (fail)
@@ -256,6 +257,21 @@ def check_data_directory() -> DiagnosticResult:
         )
 
 
+def check_yaml_backend() -> DiagnosticResult:
+    """Check whether PyYAML was built with the libyaml C backend."""
+    from lib.storage import HAS_LIBYAML
+
+    if HAS_LIBYAML:
+        return DiagnosticResult("YAML backend", True, "libyaml (C)")
+
+    # Not fatal - storage falls back to the pure-Python loader, just slower
+    return DiagnosticResult(
+        "YAML backend",
+        True,
+        "pure-Python fallback; reinstall PyYAML with libyaml for faster sync"
+    )
+
+
 async def run_diagnostics() -> list[DiagnosticResult]:
     """Run all diagnostic checks."""
     results = []
@@ -267,6 +283,7 @@ async def run_diagnostics() -> list[DiagnosticResult]:
     results.append(check_config_file())
     results.append(check_server_configured())
     results.append(check_data_directory())
+    results.append(check_yaml_backend())
 
     # Only run authentication check if token is present
     if os.getenv("DISCORD_USER_TOKEN"):
@@ -341,6 +341,8 @@ async def sync_single_server(
             failed_channels.append({"name": channel['name'], "error": str(e)})
             continue
 
+    storage.flush_sync_state(server_id, server_name)
+
     if failed_channels:
         print(f"  Warning: {len(failed_channels)} channel(s) failed")
         print(f"  Failed channels:")
@@ -461,7 +463,7 @@ async def sync_all_servers(
                 continue
 
         # Update manifest
-        manifest = storage.update_manifest()
+        manifest = storage.update_manifest_incremental()
 
         print(f"\n{'='*50}")
         print(f"SYNC COMPLETE!")
@@ -613,7 +615,7 @@ async def sync_server(
             )
 
             # Update manifest
-            manifest = storage.update_manifest()
+            manifest = storage.update_manifest_incremental()
 
             # Print formatted summary
             is_first = not storage.has_any_sync(server_id)
@@ -623,38 +625,42 @@ async def sync_server(
             # Sequential sync (single channel or parallel disabled)
             total_messages = 0
             failed_channels = []
-            for channel in channels_to_sync:
-                print(f"\n#{channel['name']}:")
-                try:
-                    count = await sync_channel(
-                        client=client,
-                        storage=storage,
-                        server_id=server_id,
-                        server_name=server_name,
-                        channel_id=channel["id"],
-                        channel_name=channel["name"],
-                        days=days,
-                        incremental=incremental,
-                        max_messages=effective_limit
-                    )
-                    total_messages += count
-                except discord.Forbidden as e:
-                    print(f"  Access denied (403)")
-                    print(f"    - You may not have 'Read Message History' permission")
-                    print(f"    - Request access or remove this channel from config")
-                    failed_channels.append({"name": channel['name'], "error": "access_denied"})
-                    continue
-                except discord.HTTPException as e:
-                    if e.status == 429:
-                        print(f"  Rate limited - retry after {getattr(e, 'retry_after', 'unknown')}s")
-                    else:
-                        print(f"  HTTP error {e.status}: {e.text}")
-                    failed_channels.append({"name": channel['name'], "error": f"http_{e.status}"})
-                    continue
-                except DiscordClientError as e:
-                    print(f"  Error: {e}")
-                    failed_channels.append({"name": channel['name'], "error": str(e)})
-                    continue
+            try:
+                for channel in channels_to_sync:
+                    print(f"\n#{channel['name']}:")
+                    try:
+                        count = await sync_channel(
+                            client=client,
+                            storage=storage,
+                            server_id=server_id,
+                            server_name=server_name,
+                            channel_id=channel["id"],
+                            channel_name=channel["name"],
+                            days=days,
+                            incremental=incremental,
+                            max_messages=effective_limit
+                        )
+                        total_messages += count
+                    except discord.Forbidden as e:
+                        print(f"  Access denied (403)")
+                        print(f"    - You may not have 'Read Message History' permission")
+                        print(f"    - Request access or remove this channel from config")
+                        failed_channels.append({"name": channel['name'], "error": "access_denied"})
+                        continue
+                    except discord.HTTPException as e:
+                        if e.status == 429:
+                            print(f"  Rate limited - retry after {getattr(e, 'retry_after', 'unknown')}s")
+                        else:
+                            print(f"  HTTP error {e.status}: {e.text}")
+                        failed_channels.append({"name": channel['name'], "error": f"http_{e.status}"})
+                        continue
+                    except DiscordClientError as e:
+                        print(f"  Error: {e}")
+                        failed_channels.append({"name": channel['name'], "error": str(e)})
+                        continue
+            finally:
+                # Compact journaled channel state even if the run is aborted
+                storage.flush_sync_state(server_id, server_name)
 
             # Report failed channels if any
             if failed_channels:
@@ -665,7 +671,7 @@ async def sync_server(
                     print(f"  - #{name} ({error})")
 
             # Update manifest with all synced data
-            manifest = storage.update_manifest()
+            manifest = storage.update_manifest_incremental()
 
             # Print summary
             data_dir = config.get_server_data_dir(server_id)